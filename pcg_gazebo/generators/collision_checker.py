@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
 import trimesh
 from ..log import PCG_ROOT_LOGGER
 from ..visualization import create_scene
@@ -22,6 +23,13 @@ class CollisionChecker(object):
     added to the collision check scene and used to check any
     other object for collisions.
 
+    The collision manager and the meshes of the scene are cached
+    between collision checks. The cache is rebuilt when models are
+    added, the scenario is reset or the pose of a scene model
+    changes. Any other change to a model already in the scene (e.g.
+    its links, collision geometries or mesh scale) requires
+    calling `invalidate()` before the next check.
+
     > *Input arguments*
 
     * `ignore_ground_plane` (*type:* `bool`, *value:* `True`):
@@ -34,6 +42,7 @@ class CollisionChecker(object):
         self._scene_models = list()
         self._simulation_scenario = trimesh.scene.Scene()
         self._ignore_ground_plane = ignore_ground_plane
+        self._scene_cache = None
         PCG_ROOT_LOGGER.info('Collision checker created')
 
     @property
@@ -62,15 +71,41 @@ class CollisionChecker(object):
             self.get_scenario())
         return manager
 
+    def invalidate(self):
+        """Discard the cached collision manager and scene meshes, so
+        that they are rebuilt from the scene models in the next
+        collision check.
+        """
+        self._scene_cache = None
+
+    def _get_scene_cache(self):
+        # The collision manager and the scene meshes are only rebuilt
+        # if the scene models were added, removed or moved since the
+        # last collision check, or if invalidate() was called
+        key = [(id(item), tuple(item.pose.position), tuple(item.pose.quat))
+               for item in self._scene_models]
+        if self._scene_cache is None or self._scene_cache[0] != key:
+            manager = self.get_collision_manager()
+            meshes = list()
+            for item in self._scene_models:
+                meshes += item.get_meshes()
+            bounds = None
+            if len(meshes) > 0:
+                bounds = np.array([item.bounds for item in meshes])
+            self._scene_cache = (key, manager, meshes, bounds)
+        return self._scene_cache[1:]
+
     def reset_all(self):
         self._simulation_scenario = trimesh.scene.Scene()
         self._scene_models = list()
         self._fixed_models = list()
+        self._scene_cache = None
 
     def reset_scenario(self):
         """Remove all meshes from collision check scene."""
         self._simulation_scenario = trimesh.scene.Scene()
         self._scene_models = list()
+        self._scene_cache = None
         PCG_ROOT_LOGGER.info('Collision checker scenario is now empty')
 
     def reset_to_fixed_model_scenario(self):
@@ -115,6 +150,7 @@ class CollisionChecker(object):
                 self._ignore_ground_plane:
             return
         self._scene_models.append(model)
+        self._scene_cache = None
 
     def show(self):
         """Display the current collision check scenario using `pyglet`."""
@@ -149,7 +185,9 @@ class CollisionChecker(object):
             'Checking model <{}> for collision with scene'.format(
                 model.name))
 
-        manager = self.get_collision_manager()
+        # Collision manager, meshes of the scene and their bounding
+        # boxes, stacked as (N, 2, 3) for the containment tests below
+        manager, scene_meshes, scene_bounds = self._get_scene_cache()
 
         meshes = model.get_meshes(mesh_type='collision')
         for mesh in meshes:
@@ -158,21 +196,29 @@ class CollisionChecker(object):
             # Check for minimum distance to any object
             if manager.min_distance_single(mesh) < min_distance:
                 return True
+            if len(scene_meshes) == 0:
+                continue
             # Test if mesh in inside another mesh in the collision
             # manager scene
             # It will only work for scene meshes that are watertight
-            for scene_model in self._scene_models:
-                for scene_mesh in scene_model.get_meshes():
-                    # Check if a scene mesh contains the model mesh
-                    # to be tested
-                    if scene_mesh.is_watertight:
-                        if scene_mesh.contains([mesh.vertices[0]]).any():
-                            return True
-                    # Check if the model mesh being tested contains
-                    # any of the scene meshes
-                    if mesh.is_watertight:
-                        if mesh.contains([scene_mesh.vertices[0]]).any():
-                            return True
+            # Either mesh can only contain the other if their
+            # bounding boxes overlap
+            lower, upper = mesh.bounds
+            is_overlapping = np.logical_and(
+                np.all(scene_bounds[:, 0, :] <= upper, axis=1),
+                np.all(scene_bounds[:, 1, :] >= lower, axis=1))
+            for i in np.flatnonzero(is_overlapping):
+                scene_mesh = scene_meshes[i]
+                # Check if a scene mesh contains the model mesh
+                # to be tested
+                if scene_mesh.is_watertight:
+                    if scene_mesh.contains([mesh.vertices[0]]).any():
+                        return True
+                # Check if the model mesh being tested contains
+                # any of the scene meshes
+                if mesh.is_watertight:
+                    if mesh.contains([scene_mesh.vertices[0]]).any():
+                        return True
 
         PCG_ROOT_LOGGER.info('No collisions for model <{}>'.format(model.name))
         return False
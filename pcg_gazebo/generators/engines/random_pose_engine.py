@@ -319,16 +319,15 @@ class RandomPoseEngine(Engine):
                 pose = self._get_random_pose(model_name)
 
                 model.pose = self._get_random_pose(model_name)
-                self._logger.info('Generated random pose: {}'.format(
-                    model.pose))
+                # The poses are only converted to strings if logged
+                self._logger.info('Generated random pose: %s', model.pose)
                 while not self.is_model_in_workspace(model):
                     self._logger.info(
                         'Model outside of the '
                         'workspace or in collision'
                         ' with other objects!')
                     pose = self._get_random_pose(model_name)
-                    self._logger.info(
-                        '\t Generated random pose: {}'.format(pose))
+                    self._logger.info('\t Generated random pose: %s', pose)
                     model.pose = pose
                 # Enforce positioning constraints
                 model = self.apply_local_constraints(model)
@@ -21,7 +21,8 @@ from shapely.ops import unary_union, polygonize, linemerge
 from ..log import PCG_ROOT_LOGGER
 from ..visualization import create_scene
 from ..simulation import SimulationModel, ModelGroup
-from ..utils import has_string_pattern, get_random_point_from_shape
+from ..utils import get_string_pattern_matcher, \
+    get_random_point_from_shape
 
 
 def _get_model_limits(model, mesh_type='collision'):
@@ -324,13 +325,10 @@ def generate_occupancy_grid(
     if ground_plane_models is None:
         ground_plane_models = list()
 
+    is_ground_plane_model = get_string_pattern_matcher(ground_plane_models)
+
     def _is_ground_plane(model):
-        if model.is_ground_plane:
-            return True
-        for tag in ground_plane_models:
-            if has_string_pattern(model.name, tag):
-                return True
-        return False
+        return model.is_ground_plane or is_ground_plane_model(model.name)
 
     scene = create_scene(list(models.values()))
 
@@ -387,15 +385,13 @@ def generate_occupancy_grid(
 
     model_occupied_areas = list()
 
-    PCG_ROOT_LOGGER.info('List of models={}'.format(list(models.keys())))
+    PCG_ROOT_LOGGER.info('List of models=%s', list(models.keys()))
 
     occupancy_output = dict(
         static=dict(),
         non_static=dict(),
         ground_plane=None)
 
-    pool = Pool(n_processes)
-
     if len(models):
         non_gp_models = list()
         for tag in models:
@@ -412,9 +408,17 @@ def generate_occupancy_grid(
             )
 
         if len(non_gp_models):
-            results = pool.map(
-                _get_occupied_area_proc,
-                non_gp_models)
+            # The worker processes are only started if there are models
+            # to process, and are terminated once all footprints are
+            # computed
+            pool = Pool(n_processes)
+            try:
+                results = pool.map(
+                    _get_occupied_area_proc,
+                    non_gp_models)
+            finally:
+                pool.close()
+                pool.join()
 
             for model_occupied_area, model_name in zip(
                     results, [x[0].name for x in non_gp_models]):
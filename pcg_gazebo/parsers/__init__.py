@@ -99,7 +99,8 @@ def parse_xacro(input_xml, output_type='urdf'):
 
 
 def parse_xml(input_xml, type='sdf'):
-    """Parse an XML file into an `collections.OrderedDict`.
+    """Parse an XML file into a `dict`, where the XML tags are the
+    keys, and convert it into a `pcg_gazebo` element.
 
     > *Input arguments*
 
@@ -110,7 +111,7 @@ def parse_xml(input_xml, type='sdf'):
 
     > *Returns*
 
-    `collections.OrderedDict`: Dictionary where the XML tags are the keys.
+    `pcg_gazebo.parsers.types.XMLBase` object.
     """
     import os
     from ..utils import is_string
@@ -136,31 +137,119 @@ def parse_xml(input_xml, type='sdf'):
 
 
 def parse_xml_str(xml_str, type='sdf'):
-    """Parse an XML formatted string into an
-    `collections.OrderedDict`.
+    """Parse an XML formatted string into a `dict`, where the XML
+    tags are the keys, and convert it into a `pcg_gazebo` element.
 
     > *Input arguments*
 
-    * `input_xml` (*type:* `str`): XML formatted text.
+    * `input_xml` (*type:* `str` or `bytes`): XML formatted text.
     * `type` (*type:* `str`): Type of XML format used in the input
     file, options are `sdf`, `urdf` or `sdf_config`.
 
     > *Returns*
 
-    `collections.OrderedDict`: Dictionary where the XML tags are the keys.
+    `pcg_gazebo.parsers.types.XMLBase` object.
     """
-    import xmltodict
-    parsed_xml = xmltodict.parse(xml_str)
+    from lxml import etree
+    # The input is always decoded as UTF-8, lxml does not accept
+    # unicode strings with an encoding declaration
+    parser = etree.XMLParser(
+        encoding='utf-8', remove_comments=True, remove_pis=True,
+        resolve_entities=False)
+    if not isinstance(xml_str, bytes):
+        xml_str = xml_str.encode('utf-8')
+    root = etree.fromstring(xml_str, parser)
+    parsed_xml = dict()
+    parsed_xml[get_xml_name(root.tag, root.nsmap)] = \
+        convert_xml_element_to_dict(root)
     return parse_xml_dict(parsed_xml, type)
 
 
+def get_xml_name(name, nsmap):
+    """Return the qualified name of a XML tag or attribute
+    (e.g. `xacro:include`) from its `lxml` name, where the namespace
+    is given by its URI (e.g. `{http://www.ros.org/wiki/xacro}include`).
+
+    > *Input arguments*
+
+    * `name` (*type:* `str`): Tag or attribute name.
+    * `nsmap` (*type:* `dict`): Map of namespace prefixes to URIs.
+
+    > *Returns*
+
+    `str`: Qualified name.
+    """
+    if name[0] != '{':
+        return name
+    uri, _, local_name = name[1:].partition('}')
+    for prefix in nsmap:
+        if prefix is not None and nsmap[prefix] == uri:
+            return '{}:{}'.format(prefix, local_name)
+    return local_name
+
+
+def convert_xml_element_to_dict(xml_element, parent_nsmap=None):
+    """Convert an `lxml.etree` element into the same dictionary
+    structure generated by `xmltodict`, with attributes as `@` keys,
+    the text as `#text` key and leaf elements as their text.
+
+    > *Input arguments*
+
+    * `xml_element` (*type:* `lxml.etree._Element`): XML element.
+    * `parent_nsmap` (*type:* `dict`, *default:* `None`): Namespaces
+    already declared by the parent elements.
+
+    > *Returns*
+
+    `dict` or `str`: XML contents of the element.
+    """
+    if parent_nsmap is None:
+        parent_nsmap = dict()
+    output = dict()
+    nsmap = xml_element.nsmap
+    # Namespaces declared in this element
+    for prefix in nsmap:
+        if parent_nsmap.get(prefix, None) != nsmap[prefix]:
+            if prefix is None:
+                output['@xmlns'] = nsmap[prefix]
+            else:
+                output['@xmlns:' + prefix] = nsmap[prefix]
+    for name, value in xml_element.attrib.items():
+        output['@' + get_xml_name(name, nsmap)] = value
+
+    text = list()
+    if xml_element.text:
+        text.append(xml_element.text)
+    for child in xml_element:
+        if child.tail:
+            text.append(child.tail)
+        # Skip non-element nodes (e.g. entities)
+        if not isinstance(child.tag, str):
+            continue
+        tag = get_xml_name(child.tag, child.nsmap)
+        value = convert_xml_element_to_dict(child, nsmap)
+        if tag not in output:
+            output[tag] = value
+        elif isinstance(output[tag], list):
+            output[tag].append(value)
+        else:
+            output[tag] = [output[tag], value]
+
+    text = ''.join(text).strip()
+    if len(output) == 0:
+        return text if len(text) else None
+    if len(text):
+        output['#text'] = text
+    return output
+
+
 def parse_xml_dict(xml_dict, type='sdf'):
-    """Converts an `collections.OrderedDict` created from a XML file
-    and return an SDF, URDF or SDF Configuration `pcg_gazebo` element.
+    """Converts a `dict` created from a XML file and return an SDF,
+    URDF or SDF Configuration `pcg_gazebo` element.
 
     > *Input arguments*
 
-    * `xml_dict` (*type:* `collections.OrderedDict`): XML contents.
+    * `xml_dict` (*type:* `dict`): XML contents.
     * `type` (*type:* `str`): Type of XML format used in the input
     file, options are `sdf`, `urdf` or `sdf_config`.
 
@@ -219,7 +308,8 @@ def convert_custom(xml_dict):
 
 
 def convert_to_dict(xml_dict):
-    """Convert the `xmltodict` output into a dictionary that can be
+    """Convert the output of `convert_xml_element_to_dict` (same format
+    as `xmltodict`) into a dictionary that can be
     parsed into a `pcg_gazebo.parsers.types.XMLBase`.
 
     > *Input arguments*
@@ -302,11 +392,7 @@ def convert_from_string(str_input_xml):
         return len(s) % 2 == 0
 
     def is_numeric(s):
-        import sys
-        if sys.version_info[0] > 2:
-            return str(s).isdigit()
-        else:
-            return s.isdigit()
+        return str(s).isdigit()
 
     if is_hex(str_input_xml):
         value = int(str_input_xml, 0)
@@ -310,32 +310,31 @@ def get_all_sdf_element_classes():
     return output
 
 
-def create_sdf_element(tag, *args):
-    import sys
-    import inspect
-    from ..types import XMLBase
+_SDF_ELEMENT_TYPES = None
 
-    current_module = sys.modules[__name__]
-    for name, obj in inspect.getmembers(current_module):
-        if inspect.isclass(obj):
-            if issubclass(obj, XMLBase):
-                if tag == obj._NAME and obj._TYPE == 'sdf':
-                    return obj(*args)
-    return None
 
+def _get_sdf_element_types():
+    # Map of tags to SDF element classes, built on the first lookup.
+    # The first class found for a tag is kept, as in the former search
+    # over the module members
+    global _SDF_ELEMENT_TYPES
+    if _SDF_ELEMENT_TYPES is None:
+        element_types = dict()
+        for obj in get_all_sdf_element_classes():
+            element_types.setdefault(obj._NAME, obj)
+        _SDF_ELEMENT_TYPES = element_types
+    return _SDF_ELEMENT_TYPES
 
-def create_sdf_type(tag):
-    import sys
-    import inspect
-    from ..types import XMLBase
 
-    current_module = sys.modules[__name__]
-    for name, obj in inspect.getmembers(current_module):
-        if inspect.isclass(obj):
-            if issubclass(obj, XMLBase):
-                if tag == obj._NAME and obj._TYPE == 'sdf':
-                    return obj
-    return None
+def create_sdf_element(tag, *args):
+    obj = _get_sdf_element_types().get(tag, None)
+    if obj is None:
+        return None
+    return obj(*args)
+
+
+def create_sdf_type(tag):
+    return _get_sdf_element_types().get(tag, None)
 
 
 def is_sdf_element(obj):
@@ -37,8 +37,9 @@ class Bullet(XMLBase):
             creator=Solver, default=['bullet'], mode='physics'),
         constraints=dict(
             creator=Constraints, default=['bullet'], mode='physics'),
+        # Lazy creator to solve the circular dependency with Friction
         friction=dict(
-            creator=None,
+            creator='pcg_gazebo.parsers.sdf.friction:Friction',
             default=['scalar', 1, 0], mode='collision'),
         friction2=dict(
             creator=Friction2, default=[1], mode='collision'),
@@ -65,9 +66,6 @@ class Bullet(XMLBase):
     _MODES = ['physics', 'collision', 'contact']
 
     def __init__(self, mode='physics'):
-        # Solve circular dependency
-        from .friction import Friction
-        self._CHILDREN_CREATORS['friction']['creator'] = Friction
         super(Bullet, self).__init__()
         self.reset(mode)
 
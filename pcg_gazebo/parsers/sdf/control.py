@@ -15,49 +15,59 @@
 
 from ..types import XMLBase
 from ...utils import is_string
-from .type import Type
-from .offset import offset
-from .p_gain import p_gain
-from .i_gain import i_gain
-from .d_gain import d_gain
-from .i_max import i_max
-from .i_min import i_min
-from .cmd_max import cmd_max
-from .cmd_min import cmd_min
-from .joint_name import joint_name
-from .multiplier import multiplier
-from .controlVelocitySlowdownSim import controlVelocitySlowdownSim
 
 
 class Control(XMLBase):
     _NAME = 'control'
     _TYPE = 'sdf'
+    __slots__ = ()
+
+    _has_custom_elements = True
 
     _ATTRIBUTES = dict(
         channel='',
     )
 
+    _ATTRIBUTES_TYPES = dict(
+        channel=int
+    )
+
+    # Child element creators are given as `module:class` and are only
+    # imported when the child element is first created
     _CHILDREN_CREATORS = dict(
-        type=dict(creator=Type, optional=True),
-        offset=dict(creator=offset, optional=True),
-        p_gain=dict(creator=p_gain, optional=True),
-        i_gain=dict(creator=i_gain, optional=True),
-        d_gain=dict(creator=d_gain, optional=True),
-        i_max=dict(creator=i_max, optional=True),
-        i_min=dict(creator=i_min, optional=True),
-        cmd_max=dict(creator=cmd_max, optional=True),
-        cmd_min=dict(creator=cmd_min, optional=True),
-        jointName=dict(creator=joint_name, optional=True),
-        multiplier=dict(creator=multiplier, optional=True),
-        controlVelocitySlowdownSim=dict(creator=controlVelocitySlowdownSim,
-                                        optional=True),
+        type=dict(
+            creator='pcg_gazebo.parsers.sdf.type:Type', optional=True),
+        offset=dict(
+            creator='pcg_gazebo.parsers.sdf.offset:offset', optional=True),
+        p_gain=dict(
+            creator='pcg_gazebo.parsers.sdf.p_gain:p_gain', optional=True),
+        i_gain=dict(
+            creator='pcg_gazebo.parsers.sdf.i_gain:i_gain', optional=True),
+        d_gain=dict(
+            creator='pcg_gazebo.parsers.sdf.d_gain:d_gain', optional=True),
+        i_max=dict(
+            creator='pcg_gazebo.parsers.sdf.i_max:i_max', optional=True),
+        i_min=dict(
+            creator='pcg_gazebo.parsers.sdf.i_min:i_min', optional=True),
+        cmd_max=dict(
+            creator='pcg_gazebo.parsers.sdf.cmd_max:cmd_max', optional=True),
+        cmd_min=dict(
+            creator='pcg_gazebo.parsers.sdf.cmd_min:cmd_min', optional=True),
+        jointName=dict(
+            creator='pcg_gazebo.parsers.sdf.joint_name:joint_name',
+            optional=True),
+        multiplier=dict(
+            creator='pcg_gazebo.parsers.sdf.multiplier:multiplier',
+            optional=True),
+        controlVelocitySlowdownSim=dict(
+            creator='pcg_gazebo.parsers.sdf.controlVelocitySlowdownSim:'
+                    'controlVelocitySlowdownSim',
+            optional=True),
     )
 
     def __init__(self):
         super(Control, self).__init__()
         self.reset()
-        self._value = None
-        self._has_custom_elements = True
 
     @property
     def channel(self):
@@ -65,102 +75,8 @@ class Control(XMLBase):
 
     @channel.setter
     def channel(self, value):
-        assert isinstance(value, int), 'control channel must be an integer'
-        self.attributes['channel'] = value
-
-    @property
-    def type(self):
-        return self._get_child_element('type')
-
-    @type.setter
-    def type(self, value):
-        self._add_child_element('type', value)
-
-    @property
-    def offset(self):
-        return self._get_child_element('offset')
-
-    @offset.setter
-    def offset(self, value):
-        self._add_child_element('offset', value)
-
-    @property
-    def p_gain(self):
-        return self._get_child_element('p_gain')
-
-    @p_gain.setter
-    def p_gain(self, value):
-        self._add_child_element('p_gain', value)
-
-    @property
-    def i_gain(self):
-        return self._get_child_element('i_gain')
-
-    @i_gain.setter
-    def i_gain(self, value):
-        self._add_child_element('i_gain', value)
-
-    @property
-    def d_gain(self):
-        return self._get_child_element('d_gain')
-
-    @d_gain.setter
-    def d_gain(self, value):
-        self._add_child_element('d_gain', value)
-
-    @property
-    def i_max(self):
-        return self._get_child_element('i_max')
-
-    @i_max.setter
-    def i_max(self, value):
-        self._add_child_element('i_max', value)
-
-    @property
-    def i_min(self):
-        return self._get_child_element('i_min')
-
-    @i_min.setter
-    def i_min(self, value):
-        self._add_child_element('i_min', value)
-
-    @property
-    def cmd_max(self):
-        return self._get_child_element('cmd_max')
-
-    @cmd_max.setter
-    def cmd_max(self, value):
-        self._add_child_element('cmd_max', value)
-
-    @property
-    def cmd_min(self):
-        return self._get_child_element('cmd_min')
-
-    @cmd_min.setter
-    def cmd_min(self, value):
-        self._add_child_element('cmd_min', value)
-
-    @property
-    def jointName(self):
-        return self._get_child_element('jointName')
-
-    @jointName.setter
-    def jointName(self, value):
-        self._add_child_element('jointName', value)
-
-    @property
-    def multiplier(self):
-        return self._get_child_element('multiplier')
-
-    @multiplier.setter
-    def multiplier(self, value):
-        self._add_child_element('multiplier', value)
-
-    @property
-    def controlVelocitySlowdownSim(self):
-        return self._get_child_element('controlVelocitySlowdownSim')
-
-    @controlVelocitySlowdownSim.setter
-    def controlVelocitySlowdownSim(self, value):
-        self._add_child_element('controlVelocitySlowdownSim', value)
+        # Accepts any integer type (e.g. numpy integers), raises a
+        # TypeError otherwise
+        self.attributes['channel'] = \
+            self._ATTRIBUTES_VALIDATORS['channel'](value)
 
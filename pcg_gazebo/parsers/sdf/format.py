@@ -23,11 +23,14 @@ class Format(XMLString):
     _VALUE_OPTIONS = ['L8', 'R8G8B8', 'B8G8R8', 'BAYER_RGGB8',
                       'BAYER_BGGR8', 'BAYER_GBRG8', 'BAYER_GRBG8',
                       'RGB_INT8', 'L_INT8']
+    # Set of the options above for the membership test of _set_value
+    _VALUE_OPTIONS_SET = frozenset(_VALUE_OPTIONS)
 
     def __init__(self, default='R8G8B8'):
         super(Format, self).__init__(default)
 
     def _set_value(self, value):
-        assert value in self._VALUE_OPTIONS, 'Bad value: {}. Options are {}'.format(
-            value, self._VALUE_OPTIONS)
+        assert isinstance(value, str) and \
+            value in self._VALUE_OPTIONS_SET, \
+            'Bad value: {}. Options are {}'.format(value, self._VALUE_OPTIONS)
         XMLString._set_value(self, value)
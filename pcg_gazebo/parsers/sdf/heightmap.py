@@ -25,6 +25,7 @@ from .blend import Blend
 class Heightmap(XMLBase):
     _NAME = 'heightmap'
     _TYPE = 'sdf'
+    __slots__ = ()
 
     _MODES = ['visual', 'collision']
 
@@ -35,12 +36,12 @@ class Heightmap(XMLBase):
             mode=['collision', 'visual']),
         size=dict(
             creator=Size,
-            default=[[1, 1, 1]],
+            default=((1, 1, 1),),
             mode=['collision', 'visual'],
             optional=True),
         pos=dict(
             creator=Pos,
-            default=[[0, 0, 0]],
+            default=((0, 0, 0),),
             optional=True,
             mode=['collision', 'visual']),
         texture=dict(
@@ -50,10 +51,10 @@ class Heightmap(XMLBase):
             optional=True),
         blend=dict(creator=Blend, n_elems='+', mode='visual', optional=True),
         use_terrain_paging=dict(
-            creator=UseTerrainPaging, default=[False],
+            creator=UseTerrainPaging, default=(False,),
             optional=True, mode='visual'),
         sampling=dict(
-            creator=Sampling, default=[2],
+            creator=Sampling, default=(2,),
             optional=True, mode='visual')
     )
 
@@ -61,30 +62,6 @@ class Heightmap(XMLBase):
         super(Heightmap, self).__init__()
         self.reset(mode=mode)
 
-    @property
-    def uri(self):
-        return self._get_child_element('uri')
-
-    @uri.setter
-    def uri(self, value):
-        self._add_child_element('uri', value)
-
-    @property
-    def size(self):
-        return self._get_child_element('size')
-
-    @size.setter
-    def size(self, value):
-        self._add_child_element('size', value)
-
-    @property
-    def pos(self):
-        return self._get_child_element('pos')
-
-    @pos.setter
-    def pos(self, value):
-        self._add_child_element('pos', value)
-
     @property
     def use_terrain_paging(self):
         return self._get_child_element('use_terrain_paging')
@@ -109,7 +86,7 @@ class Heightmap(XMLBase):
     def textures(self):
         return self._get_child_element('texture')
 
-    def add_texture(self, name=None, texture=None):
+    def add_texture(self, texture):
         if self._mode != 'visual':
             self._mode = 'visual'
         self._add_child_element('texture', texture)
@@ -118,7 +95,7 @@ class Heightmap(XMLBase):
     def blends(self):
         return self._get_child_element('blend')
 
-    def add_blend(self, name=None, blend=None):
+    def add_blend(self, blend):
         if self._mode != 'visual':
             self._mode = 'visual'
         self._add_child_element('blend', blend)
@@ -14,140 +14,223 @@
 # limitations under the License.
 
 from ..types import XMLBase
-from ...utils import is_string
-from .control import Control
-from .always_On import AlwaysOn
-from .update_rate import UpdateRate
-from .topic import Topic
-from .noise import Noise
-from .xyzOffset import xyzOffset
-from .xyzOffsets import XyzOffsets
-from .rpyOffset import RpyOffset
-from .rpyOffsets import RpyOffsets
-from .name import Name
-from .frame_name import FrameName
-from .body_name import BodyName
-from .link_name import LinkName
-from .fdm_addr import FdmAddr
-from .imu_name import ImuName
-from .prefix import Prefix
-from .color_optical_frame_name import ColorOpticalFrameName
-from .depth_optical_frame_name import DepthOpticalFrameName
-from .infrared1_optical_frame_name import Infrared1OpticalFrameName
-from .infrared2_optical_frame_name import Infrared2OpticalFrameName
-from .a0 import a0
-from .alpha_stall import alpha_stall
-from .cla import cla
-from .cda import cda
-from .cma import cma
-from .cla_stall import cla_stall
-from .cda_stall import cda_stall
-from .cma_stall import cma_stall
-from .area import area
-from .air_density import air_density
-from .range_min_depth import rangeMinDepth
-from .range_max_depth import rangeMaxDepth
-from .point_cloud import pointCloud
-from .pointCloudTopicName import pointCloudTopicName
-from .point_cloud_cutoff import pointCloudCutoff
-from .initialOrientationAsReference import initialOrientationAsReference
-from .fdm_port_in import fdm_port_in
-from .fdm_port_out import fdm_port_out
-from .connectionTimeoutMaxCount import connectionTimeoutMaxCount
-from .cp import cp
-from .forward import forward
-from .upward import upward
-from .topicName import topicName
-from .gaussian_noise import gaussianNoise
-from .depthTopicName import depthTopicName
-from .depthCameraInfoTopicName import depthCameraInfoTopicName
-from .colorTopicName import colorTopicName
-from .colorCameraInfoTopicName import colorCameraInfoTopicName
-from .infrared1TopicName import infrared1TopicName
-from .infrared1CameraInfoTopicName import infrared1CameraInfoTopicName
-from .infrared2TopicName import infrared2TopicName
-from .infrared2CameraInfoTopicName import infrared2CameraInfoTopicName
-from .updateRate import updateRate
-from .updateRateHZ import updateRateHZ
-from .depthUpdateRate import depthUpdateRate
-from .colorUpdateRate import colorUpdateRate
-from .infraredUpdateRate import infraredUpdateRate
-from .modelXYZToAirplaneXForwardZDown import modelXYZToAirplaneXForwardZDown
-from .gazeboXYZToNED import gazeboXYZToNED
+
+# Library filenames used by the plugin factory methods, already known
+# to be valid
+_LIB_GAZEBO_ROS_CONTROL = 'libgazebo_ros_control.so'
+_LIB_GAZEBO_ROS_BUMPER = 'libgazebo_ros_bumper.so'
+_LIB_GAZEBO_ROS_FT_SENSOR = 'libgazebo_ros_ft_sensor.so'
+_LIB_GAZEBO_ROS_P3D = 'libgazebo_ros_p3d.so'
+
+_KNOWN_PLUGIN_FILENAMES = frozenset([
+    _LIB_GAZEBO_ROS_CONTROL,
+    _LIB_GAZEBO_ROS_BUMPER,
+    _LIB_GAZEBO_ROS_FT_SENSOR,
+    _LIB_GAZEBO_ROS_P3D
+])
 
 
 class Plugin(XMLBase):
     _NAME = 'plugin'
     _TYPE = 'sdf'
+    __slots__ = ()
+
+    _has_custom_elements = True
 
     _ATTRIBUTES = dict(
         name='',
         filename=''
     )
 
+    # Child element creators are given as `module:class` and are only
+    # imported when the child element is first created
     _CHILDREN_CREATORS = dict(
-        control=dict(creator=Control, n_elems='+', optional=True),
-        alwaysOn=dict(creator=AlwaysOn, optional=True),
-        updateRate=dict(creator=updateRate, optional=True),
-        updateRateHZ=dict(creator=updateRateHZ, optional=True),
-        bodyName=dict(creator=BodyName, optional=True),
-        topicName=dict(creator=topicName, optional=True),
-        gaussianNoise=dict(creator=gaussianNoise, optional=True),
-        frameName=dict(creator=FrameName, optional=True),
-        xyzOffsets=dict(creator=XyzOffsets, optional=True),
-        xyzOffset=dict(creator=xyzOffset, optional=True),
-        rpyOffsets=dict(creator=RpyOffsets, optional=True),
-        rpyOffset=dict(creator=RpyOffset, optional=True),
-        a0=dict(creator=a0, optional=True),
-        alpha_stall=dict(creator=alpha_stall, optional=True),
-        cla=dict(creator=cla, optional=True),
-        cda=dict(creator=cda, optional=True),
-        cma=dict(creator=cma, optional=True),
-        cla_stall=dict(creator=cla_stall, optional=True),
-        cda_stall=dict(creator=cda_stall, optional=True),
-        cma_stall=dict(creator=cma_stall, optional=True),
-        area=dict(creator=area, optional=True),
-        air_density=dict(creator=air_density, optional=True),
-        cp=dict(creator=cp, optional=True),
-        forward=dict(creator=forward, optional=True),
-        upward=dict(creator=upward, optional=True),
-        link_name=dict(creator=LinkName, optional=True),
-        fdm_addr=dict(creator=FdmAddr, optional=True),
-        fdm_port_in=dict(creator=fdm_port_in, optional=True),
-        fdm_port_out=dict(creator=fdm_port_out, optional=True),
-        modelXYZToAirplaneXForwardZDown=dict(creator=modelXYZToAirplaneXForwardZDown, optional=True),
-        gazeboXYZToNED=dict(creator=gazeboXYZToNED, optional=True),
-        imuName=dict(creator=ImuName, optional=True),
-        connectionTimeoutMaxCount=dict(creator=connectionTimeoutMaxCount, optional=True),
-        initialOrientationAsReference=dict(creator=initialOrientationAsReference, optional=True),
-        prefix=dict(creator=Prefix, optional=True),
-        depthUpdateRate=dict(creator=depthUpdateRate, optional=True),
-        colorUpdateRate=dict(creator=colorUpdateRate, optional=True),
-        infraredUpdateRate=dict(creator=infraredUpdateRate, optional=True),
-        depthTopicName=dict(creator=depthTopicName, optional=True),
-        depthCameraInfoTopicName=dict(creator=depthCameraInfoTopicName, optional=True),
-        colorTopicName=dict(creator=colorTopicName, optional=True),
-        colorCameraInfoTopicName=dict(creator=colorCameraInfoTopicName, optional=True),
-        infrared1TopicName=dict(creator=infrared1TopicName, optional=True),
-        infrared1CameraInfoTopicName=dict(creator=infrared1CameraInfoTopicName, optional=True),
-        infrared2TopicName=dict(creator=infrared2TopicName, optional=True),
-        infrared2CameraInfoTopicName=dict(creator=infrared2CameraInfoTopicName, optional=True),
-        colorOpticalframeName=dict(creator=ColorOpticalFrameName, optional=True),
-        depthOpticalframeName=dict(creator=DepthOpticalFrameName, optional=True),
-        infrared1OpticalframeName=dict(creator=Infrared1OpticalFrameName, optional=True),
-        infrared2OpticalframeName=dict(creator=Infrared2OpticalFrameName, optional=True),
-        rangeMinDepth=dict(creator=rangeMinDepth, optional=True),
-        rangeMaxDepth=dict(creator=rangeMaxDepth, optional=True),
-        pointCloud=dict(creator=pointCloud, optional=True),
-        pointCloudTopicName=dict(creator=pointCloudTopicName, optional=True),
-        pointCloudCutoff=dict(creator=pointCloudCutoff, optional=True),
+        control=dict(
+            creator='pcg_gazebo.parsers.sdf.control:Control',
+            n_elems='+', optional=True),
+        alwaysOn=dict(
+            creator='pcg_gazebo.parsers.sdf.always_On:AlwaysOn',
+            optional=True),
+        updateRate=dict(
+            creator='pcg_gazebo.parsers.sdf.updateRate:updateRate',
+            optional=True),
+        updateRateHZ=dict(
+            creator='pcg_gazebo.parsers.sdf.updateRateHZ:updateRateHZ',
+            optional=True),
+        bodyName=dict(
+            creator='pcg_gazebo.parsers.sdf.body_name:BodyName',
+            optional=True),
+        topicName=dict(
+            creator='pcg_gazebo.parsers.sdf.topicName:topicName',
+            optional=True),
+        gaussianNoise=dict(
+            creator='pcg_gazebo.parsers.sdf.gaussian_noise:gaussianNoise',
+            optional=True),
+        frameName=dict(
+            creator='pcg_gazebo.parsers.sdf.frame_name:FrameName',
+            optional=True),
+        xyzOffsets=dict(
+            creator='pcg_gazebo.parsers.sdf.xyzOffsets:XyzOffsets',
+            optional=True),
+        xyzOffset=dict(
+            creator='pcg_gazebo.parsers.sdf.xyzOffset:xyzOffset',
+            optional=True),
+        rpyOffsets=dict(
+            creator='pcg_gazebo.parsers.sdf.rpyOffsets:RpyOffsets',
+            optional=True),
+        rpyOffset=dict(
+            creator='pcg_gazebo.parsers.sdf.rpyOffset:RpyOffset',
+            optional=True),
+        a0=dict(
+            creator='pcg_gazebo.parsers.sdf.a0:a0',
+            optional=True),
+        alpha_stall=dict(
+            creator='pcg_gazebo.parsers.sdf.alpha_stall:alpha_stall',
+            optional=True),
+        cla=dict(
+            creator='pcg_gazebo.parsers.sdf.cla:cla',
+            optional=True),
+        cda=dict(
+            creator='pcg_gazebo.parsers.sdf.cda:cda',
+            optional=True),
+        cma=dict(
+            creator='pcg_gazebo.parsers.sdf.cma:cma',
+            optional=True),
+        cla_stall=dict(
+            creator='pcg_gazebo.parsers.sdf.cla_stall:cla_stall',
+            optional=True),
+        cda_stall=dict(
+            creator='pcg_gazebo.parsers.sdf.cda_stall:cda_stall',
+            optional=True),
+        cma_stall=dict(
+            creator='pcg_gazebo.parsers.sdf.cma_stall:cma_stall',
+            optional=True),
+        area=dict(
+            creator='pcg_gazebo.parsers.sdf.area:area',
+            optional=True),
+        air_density=dict(
+            creator='pcg_gazebo.parsers.sdf.air_density:air_density',
+            optional=True),
+        cp=dict(
+            creator='pcg_gazebo.parsers.sdf.cp:cp',
+            optional=True),
+        forward=dict(
+            creator='pcg_gazebo.parsers.sdf.forward:forward',
+            optional=True),
+        upward=dict(
+            creator='pcg_gazebo.parsers.sdf.upward:upward',
+            optional=True),
+        link_name=dict(
+            creator='pcg_gazebo.parsers.sdf.link_name:LinkName',
+            optional=True),
+        fdm_addr=dict(
+            creator='pcg_gazebo.parsers.sdf.fdm_addr:FdmAddr',
+            optional=True),
+        fdm_port_in=dict(
+            creator='pcg_gazebo.parsers.sdf.fdm_port_in:fdm_port_in',
+            optional=True),
+        fdm_port_out=dict(
+            creator='pcg_gazebo.parsers.sdf.fdm_port_out:fdm_port_out',
+            optional=True),
+        modelXYZToAirplaneXForwardZDown=dict(
+            creator='pcg_gazebo.parsers.sdf.modelXYZToAirplaneXForwardZDown:'
+                    'modelXYZToAirplaneXForwardZDown',
+            optional=True),
+        gazeboXYZToNED=dict(
+            creator='pcg_gazebo.parsers.sdf.gazeboXYZToNED:gazeboXYZToNED',
+            optional=True),
+        imuName=dict(
+            creator='pcg_gazebo.parsers.sdf.imu_name:ImuName',
+            optional=True),
+        connectionTimeoutMaxCount=dict(
+            creator='pcg_gazebo.parsers.sdf.connectionTimeoutMaxCount:'
+                    'connectionTimeoutMaxCount',
+            optional=True),
+        initialOrientationAsReference=dict(
+            creator='pcg_gazebo.parsers.sdf.initialOrientationAsReference:'
+                    'initialOrientationAsReference',
+            optional=True),
+        prefix=dict(
+            creator='pcg_gazebo.parsers.sdf.prefix:Prefix',
+            optional=True),
+        depthUpdateRate=dict(
+            creator='pcg_gazebo.parsers.sdf.depthUpdateRate:depthUpdateRate',
+            optional=True),
+        colorUpdateRate=dict(
+            creator='pcg_gazebo.parsers.sdf.colorUpdateRate:colorUpdateRate',
+            optional=True),
+        infraredUpdateRate=dict(
+            creator='pcg_gazebo.parsers.sdf.infraredUpdateRate:'
+                    'infraredUpdateRate',
+            optional=True),
+        depthTopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.depthTopicName:depthTopicName',
+            optional=True),
+        depthCameraInfoTopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.depthCameraInfoTopicName:'
+                    'depthCameraInfoTopicName',
+            optional=True),
+        colorTopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.colorTopicName:colorTopicName',
+            optional=True),
+        colorCameraInfoTopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.colorCameraInfoTopicName:'
+                    'colorCameraInfoTopicName',
+            optional=True),
+        infrared1TopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.infrared1TopicName:'
+                    'infrared1TopicName',
+            optional=True),
+        infrared1CameraInfoTopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.infrared1CameraInfoTopicName:'
+                    'infrared1CameraInfoTopicName',
+            optional=True),
+        infrared2TopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.infrared2TopicName:'
+                    'infrared2TopicName',
+            optional=True),
+        infrared2CameraInfoTopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.infrared2CameraInfoTopicName:'
+                    'infrared2CameraInfoTopicName',
+            optional=True),
+        colorOpticalframeName=dict(
+            creator='pcg_gazebo.parsers.sdf.color_optical_frame_name:'
+                    'ColorOpticalFrameName',
+            optional=True),
+        depthOpticalframeName=dict(
+            creator='pcg_gazebo.parsers.sdf.depth_optical_frame_name:'
+                    'DepthOpticalFrameName',
+            optional=True),
+        infrared1OpticalframeName=dict(
+            creator='pcg_gazebo.parsers.sdf.infrared1_optical_frame_name:'
+                    'Infrared1OpticalFrameName',
+            optional=True),
+        infrared2OpticalframeName=dict(
+            creator='pcg_gazebo.parsers.sdf.infrared2_optical_frame_name:'
+                    'Infrared2OpticalFrameName',
+            optional=True),
+        rangeMinDepth=dict(
+            creator='pcg_gazebo.parsers.sdf.range_min_depth:rangeMinDepth',
+            optional=True),
+        rangeMaxDepth=dict(
+            creator='pcg_gazebo.parsers.sdf.range_max_depth:rangeMaxDepth',
+            optional=True),
+        pointCloud=dict(
+            creator='pcg_gazebo.parsers.sdf.point_cloud:pointCloud',
+            optional=True),
+        pointCloudTopicName=dict(
+            creator='pcg_gazebo.parsers.sdf.pointCloudTopicName:'
+                    'pointCloudTopicName',
+            optional=True),
+        pointCloudCutoff=dict(
+            creator='pcg_gazebo.parsers.sdf.point_cloud_cutoff:'
+                    'pointCloudCutoff',
+            optional=True)
     )
 
-    def __init__(self, default=dict()):
+    def __init__(self):
         XMLBase.__init__(self)
-        self._has_custom_elements = True
         self.reset()
-        self._value = None
 
     @property
     def name(self):
@@ -166,8 +249,9 @@ class Plugin(XMLBase):
     @filename.setter
     def filename(self, value):
         assert isinstance(value, str), 'Plugin filename must be a string'
-        assert len(value) > 0, 'Plugin filename cannot be empty'
-        assert '.so' in value, 'Invalid plugin filename'
+        if value not in _KNOWN_PLUGIN_FILENAMES:
+            assert len(value) > 0, 'Plugin filename cannot be empty'
+            assert value.endswith('.so'), 'Invalid plugin filename'
         self.attributes['filename'] = value
 
     @property
@@ -178,446 +262,6 @@ class Plugin(XMLBase):
     def control(self, value):
         self._add_child_element('control', value)
 
-    @property
-    def alwaysOn(self):
-        return self._get_child_element('alwaysOn')
-    
-    @alwaysOn.setter
-    def alwaysOn(self, value):
-        self._add_child_element('alwaysOn', value) 
-    
-    @property
-    def updateRate(self):
-        return self._get_child_element('updateRate')
-    
-    @updateRate.setter
-    def updateRate(self, value):
-        self._add_child_element('updateRate', value) 
-        
-    @property
-    def updateRateHZ(self):
-        return self._get_child_element('updateRateHZ')
-    
-    @updateRateHZ.setter
-    def updateRateHZ(self, value):
-        self._add_child_element('updateRateHZ', value) 
-        
-    @property
-    def bodyName(self):
-        return self._get_child_element('bodyName')
-    
-    @bodyName.setter
-    def bodyName(self, value):
-        self._add_child_element('bodyName', value) 
-        
-    @property
-    def topicName(self):
-        return self._get_child_element('topicName')
-    
-    @topicName.setter
-    def topicName(self, value):
-        self._add_child_element('topicName', value)  
-        
-    @property
-    def gaussianNoise(self):
-        return self._get_child_element('gaussianNoise')
-
-    @gaussianNoise.setter
-    def gaussianNoise(self, value):
-        self._add_child_element('gaussianNoise', value) 
-
-    @property
-    def frameName(self):
-        return self._get_child_element('frameName')
-
-    @frameName.setter
-    def frameName(self, value):
-        self._add_child_element('frameName', value)
-        
-    @property
-    def xyzOffsets(self):
-        return self._get_child_element('xyzOffsets')
-
-    @xyzOffsets.setter
-    def xyzOffsets(self, value):
-        self._add_child_element('xyzOffsets', value)
-
-    @property
-    def xyzOffset(self):
-        return self._get_child_element('xyzOffset')
-
-    @xyzOffset.setter
-    def xyzOffset(self, value):
-        self._add_child_element('xyzOffset', value)
-
-    @property
-    def rpyOffsets(self):
-        return self._get_child_element('rpyOffsets')
-
-    @rpyOffsets.setter
-    def rpyOffsets(self, value):
-        self._add_child_element('rpyOffsets', value)
-
-    @property
-    def rpyOffset(self):
-        return self._get_child_element('rpyOffset')
-
-    @rpyOffset.setter
-    def rpyOffset(self, value):
-        self._add_child_element('rpyOffset', value)
-        
-    @property
-    def a0(self):
-        return self._get_child_element('a0')
-    
-    @a0.setter
-    def a0(self, value):
-        self._add_child_element('a0', value) 
-        
-    @property
-    def alpha_stall(self):
-        return self._get_child_element('alpha_stall')
-
-    @alpha_stall.setter
-    def alpha_stall(self, value):
-        self._add_child_element('alpha_stall', value) 
-        
-    @property
-    def cla(self):
-        return self._get_child_element('cla')
-    
-    @cla.setter
-    def cla(self, value):
-        self._add_child_element('cla', value) 
-        
-    @property
-    def cda(self):
-        return self._get_child_element('cda')
-    
-    @cda.setter
-    def cda(self, value):
-        self._add_child_element('cda', value) 
-        
-    @property
-    def cma(self):
-        return self._get_child_element('cma')
-    
-    @cma.setter
-    def cma(self, value):
-        self._add_child_element('cma', value) 
-        
-    @property
-    def cla_install(self):
-        return self._get_child_element('cla_install')
-        
-    @cla_install.setter
-    def cla_install(self, value):
-        self._add_child_element('cla_install', value) 
-        
-    @property
-    def cda_install(self):
-        return self._get_child_element('cda_install')
-        
-    
-    @cda_install.setter
-    def cda_install(self, value):
-        self._add_child_element('cda_install', value) 
-        
-    @property
-    def cma_install(self):
-        return self._get_child_element('cma_install')
-    
-    @cma_install.setter
-    def cma_install(self, value):
-        self._add_child_element('cma_install', value) 
-        
-    @property
-    def area(self):
-        return self._get_child_element('area')
-    
-    @area.setter
-    def area(self, value):
-        self._add_child_element('area', value)  
-        
-    @property
-    def air_density(self):
-        return self._get_child_element('air_density')
-    
-    @air_density.setter
-    def air_density(self, value):
-        self._add_child_element('air_density', value) 
-        
-    @property
-    def cp(self):
-        return self._get_child_element('cp')
-    
-    @cp.setter
-    def cp(self, value):
-        self._add_child_element('cp', value) 
-        
-    @property
-    def forward(self):
-        return self._get_child_element('forward')
-        
-    @forward.setter
-    def forward(self, value):
-        self._add_child_element('forward', value) 
-        
-    @property
-    def upward(self):
-        return self._get_child_element('upward')
-        
-    @upward.setter
-    def upward(self, value):
-        self._add_child_element('upward', value) 
-        
-    @property
-    def link_name(self):
-        return self._get_child_element('link_name')
-        
-    @link_name.setter
-    def link_name(self, value):
-        self._add_child_element('link_name', value) 
-        
-    @property
-    def fdm_addr(self):
-        return self._get_child_element('fdm_addr')
-    
-    @fdm_addr.setter
-    def fdm_addr(self, value):
-        self._add_child_element('fdm_addr', value) 
-        
-    @property
-    def fdm_port_in(self):
-        return self._get_child_element('fdm_port_in')
-        
-    @fdm_port_in.setter
-    def fdm_port_in(self, value):
-        self._add_child_element('fdm_port_in', value) 
-        
-    @property
-    def fdm_port_out(self):
-        return self._get_child_element('fdm_port_out')
-        
-    @fdm_port_out.setter
-    def fdm_port_out(self, value):
-        self._add_child_element('fdm_port_out', value) 
-        
-    @property
-    def modelXYZToAirplaneXForwardZDown(self):
-        return self._get_child_element('modelXYZToAirplaneXForwardZDown')
-
-    @modelXYZToAirplaneXForwardZDown.setter
-    def modelXYZToAirplaneXForwardZDown(self, value):
-        self._add_child_element('modelXYZToAirplaneXForwardZDown', value) 
-        
-    @property
-    def gazeboXYZToNED(self):
-        return self._get_child_element('gazeboXYZToNED')
-
-    @gazeboXYZToNED.setter
-    def gazeboXYZToNED(self, value):
-        self._add_child_element('gazeboXYZToNED', value) 
-
-    @property
-    def imuName(self):
-        return self._get_child_element('imuName')
-
-    @imuName.setter
-    def imuName(self, value):
-        self._add_child_element('imuName', value)
-
-    @property
-    def connectionTimeoutMaxCount(self):
-        return self._get_child_element('connectionTimeoutMaxCount')
-
-    @connectionTimeoutMaxCount.setter
-    def connectionTimeoutMaxCount(self, value):
-        self._add_child_element('connectionTimeoutMaxCount', value)
-
-    @property
-    def initialOrientationAsReference(self):
-        return self._get_child_element('initialOrientationAsReference')
-
-
-    @initialOrientationAsReference.setter
-    def initialOrientationAsReference(self, value):
-        self._add_child_element('initialOrientationAsReference', value)
-
-    @property
-    def prefix(self):
-        return self._get_child_element('prefix')
-
-    @prefix.setter
-    def prefix(self, value):
-        self._add_child_element('prefix', value)
-
-    @property
-    def depthUpdateRate(self):
-        return self._get_child_element('depthUpdateRate')
-
-    @depthUpdateRate.setter
-    def depthUpdateRate(self, value):
-        self._add_child_element('depthUpdateRate', value)
-
-    @property
-    def colorUpdateRate(self):
-        return self._get_child_element('colorUpdateRate')
-
-    @colorUpdateRate.setter
-    def colorUpdateRate(self, value):
-        self._add_child_element('colorUpdateRate', value)
-
-    @property
-    def infraredUpdateRate(self):
-        return self._get_child_element('infraredUpdateRate')
-        
-    
-    @infraredUpdateRate.setter
-    def infraredUpdateRate(self, value):
-        self._add_child_element('infraredUpdateRate', value) 
-
-    @property
-    def depthTopicName(self):
-        return self._get_child_element('depthTopicName')
-
-
-    @depthTopicName.setter
-    def depthTopicName(self, value):
-        self._add_child_element('depthTopicName', value)
-
-    @property
-    def depthCameraInfoTopicName(self):
-        return self._get_child_element('depthCameraInfoTopicName')
-
-
-    @depthCameraInfoTopicName.setter
-    def depthCameraInfoTopicName(self, value):
-        self._add_child_element('depthCameraInfoTopicName', value)
-
-    @property
-    def colorTopicName(self):
-        return self._get_child_element('colorTopicName')
-        
-    
-    @colorTopicName.setter
-    def colorTopicName(self, value):
-        self._add_child_element('colorTopicName', value) 
-
-    @property
-    def colorCameraInfoTopicName(self):
-        return self._get_child_element('colorCameraInfoTopicName')
-        
-    
-    @colorCameraInfoTopicName.setter
-    def colorCameraInfoTopicName(self, value):
-        self._add_child_element('colorCameraInfoTopicName', value) 
-
-    @property
-    def infrared1TopicName(self):
-        return self._get_child_element('infrared1TopicName')
-
-
-    @infrared1TopicName.setter
-    def infrared1TopicName(self, value):
-        self._add_child_element('infrared1TopicName', value)
-
-    @property
-    def infrared1CameraInfoTopicName(self):
-        return self._get_child_element('infrared1CameraInfoTopicName')
-
-    @infrared1CameraInfoTopicName.setter
-    def infrared1CameraInfoTopicName(self, value):
-        self._add_child_element('infrared1CameraInfoTopicName', value)
-
-    @property
-    def infrared2TopicName(self):
-        return self._get_child_element('infrared2TopicName')
-
-    @infrared2TopicName.setter
-    def infrared2TopicName(self, value):
-        self._add_child_element('infrared2TopicName', value)
-
-    @property
-    def infrared2CameraInfoTopicName(self):
-        return self._get_child_element('infrared2CameraInfoTopicName')
-
-    @infrared2CameraInfoTopicName.setter
-    def infrared2CameraInfoTopicName(self, value):
-        self._add_child_element('infrared2CameraInfoTopicName', value)
-
-    @property
-    def colorOpticalframeName(self):
-        return self._get_child_element('colorOpticalframeName')
-        
-    @colorOpticalframeName.setter
-    def colorOpticalframeName(self, value):
-        self._add_child_element('colorOpticalframeName', value) 
-
-    @property
-    def depthOpticalframeName(self):
-        return self._get_child_element('depthOpticalframeName')
-    
-    @depthOpticalframeName.setter
-    def depthOpticalframeName(self, value):
-        self._add_child_element('depthOpticalframeName', value) 
-
-    @property
-    def infrared1OpticalframeName(self):
-        return self._get_child_element('infrared1OpticalframeName')
-        
-    @infrared1OpticalframeName.setter
-    def infrared1OpticalframeName(self, value):
-        self._add_child_element('infrared1OpticalframeName', value) 
-
-    @property
-    def infrared2OpticalframeName(self):
-        return self._get_child_element('infrared2OpticalframeName')
-        
-    @infrared2OpticalframeName.setter
-    def infrared2OpticalframeName(self, value):
-        self._add_child_element('infrared2OpticalframeName', value) 
-
-    @property
-    def rangeMinDepth(self):
-        return self._get_child_element('rangeMinDepth')
-
-    @rangeMinDepth.setter
-    def rangeMinDepth(self, value):
-        self._add_child_element('rangeMinDepth', value)
-
-    @property
-    def rangeMaxDepth(self):
-        return self._get_child_element('rangeMaxDepth')
-
-    @rangeMaxDepth.setter
-    def rangeMaxDepth(self, value):
-        self._add_child_element('rangeMaxDepth', value)
-
-    @property
-    def pointCloud(self):
-        return self._get_child_element('pointCloud')
-
-    @pointCloud.setter
-    def pointCloud(self, value):
-        self._add_child_element('pointCloud', value)
-
-    @property
-    def pointCloudTopicName(self):
-        return self._get_child_element('pointCloudTopicName')
-
-    @pointCloudTopicName.setter
-    def pointCloudTopicName(self, value):
-        self._add_child_element('pointCloudTopicName', value)
-
-    @property
-    def pointCloudCutoff(self):
-        return self._get_child_element('pointCloudCutoff')
-
-    @pointCloudCutoff.setter
-    def pointCloudCutoff(self, value):
-        self._add_child_element('pointCloudCutoff', value)
-
     @staticmethod
     def gazebo_ros_control(name='gazebo_ros_control', robot_namespace='',
                            control_period=None,
@@ -625,10 +269,9 @@ class Plugin(XMLBase):
                            robot_sim_type=None):
         obj = Plugin()
         obj.name = name
-        obj.filename = 'libgazebo_ros_control.so'
+        obj.filename = _LIB_GAZEBO_ROS_CONTROL
 
-        params = dict()
-        params['robotNamespace'] = robot_namespace
+        params = {'robotNamespace': robot_namespace}
         if control_period is not None:
             assert isinstance(control_period, float) or isinstance(
                 control_period, int), 'Control period must be numeric'
@@ -647,13 +290,13 @@ class Plugin(XMLBase):
                           frame_name='world'):
         obj = Plugin()
         obj.name = name
-        obj.filename = 'libgazebo_ros_bumper.so'
+        obj.filename = _LIB_GAZEBO_ROS_BUMPER
 
-        params = dict()
-        params['robotNamespace'] = robot_namespace
-        params['bumperTopicName'] = bumper_topic_name
-        params['frameName'] = frame_name
-        obj.value = params
+        obj.value = {
+            'robotNamespace': robot_namespace,
+            'bumperTopicName': bumper_topic_name,
+            'frameName': frame_name
+        }
         return obj
 
     @staticmethod
@@ -664,37 +307,37 @@ class Plugin(XMLBase):
         assert joint_name is not None, 'Joint name is missing'
         obj = Plugin()
         obj.name = name
-        obj.filename = 'libgazebo_ros_ft_sensor.so'
-
-        params = dict()
-        params['robotNamespace'] = robot_namespace
-        params['topicName'] = topic_name
-        params['jointName'] = joint_name
-        params['gaussianNoise'] = gaussian_noise
-        params['updateRate'] = update_rate
-        obj.value = params
+        obj.filename = _LIB_GAZEBO_ROS_FT_SENSOR
+
+        obj.value = {
+            'robotNamespace': robot_namespace,
+            'topicName': topic_name,
+            'jointName': joint_name,
+            'gaussianNoise': gaussian_noise,
+            'updateRate': update_rate
+        }
         return obj
 
     @staticmethod
     def gazebo_ros_p3d(name='gazebo_ros_p3d', robot_namespace='',
                        body_name=None, topic_name=None, frame_name='world',
-                       xyz_offset=[0, 0, 0], rpy_offset=[0, 0, 0],
+                       xyz_offset=(0, 0, 0), rpy_offset=(0, 0, 0),
                        gaussian_noise=0, update_rate=0):
         assert topic_name is not None, 'Topic name is missing'
         assert body_name is not None, 'Body name is missing'
 
         obj = Plugin()
         obj.name = name
-        obj.filename = 'libgazebo_ros_p3d.so'
-
-        params = dict()
-        params['robotNamespace'] = robot_namespace
-        params['topicName'] = topic_name
-        params['bodyName'] = body_name
-        params['frameName'] = frame_name
-        params['xyzOffset'] = xyz_offset
-        params['rpyOffset'] = rpy_offset
-        params['gaussianNoise'] = gaussian_noise
-        params['updateRate'] = update_rate
-        obj.value = params
+        obj.filename = _LIB_GAZEBO_ROS_P3D
+
+        obj.value = {
+            'robotNamespace': robot_namespace,
+            'topicName': topic_name,
+            'bodyName': body_name,
+            'frameName': frame_name,
+            'xyzOffset': list(xyz_offset),
+            'rpyOffset': list(rpy_offset),
+            'gaussianNoise': gaussian_noise,
+            'updateRate': update_rate
+        }
         return obj
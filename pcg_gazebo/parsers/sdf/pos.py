@@ -21,4 +21,4 @@ class Pos(XMLVector):
 
     def __init__(self, default=[0, 0, 0]):
         super(Pos, self).__init__(3)
-        self._value = default
+        self.value = default
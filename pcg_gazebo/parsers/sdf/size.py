@@ -21,7 +21,7 @@ class Size(XMLVector):
 
     def __init__(self, default=[0, 0, 0]):
         super(Size, self).__init__(len(default), min_value=0)
-        self._value = default
+        self.value = default
 
     @property
     def width(self):
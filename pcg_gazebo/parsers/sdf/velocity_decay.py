@@ -20,6 +20,7 @@ from .angular import Angular
 class velocity_decay(XMLBase):
     _NAME = 'velocity_decay'
     _TYPE = 'sdf'
+    __slots__ = ()
 
     _CHILDREN_CREATORS = dict(
         linear=dict(creator=Linear, optional=True),
@@ -29,19 +30,3 @@ class velocity_decay(XMLBase):
     def __init__(self):
         super().__init__()
         self.reset()
-
-    @property
-    def linear(self):
-        return self._get_child_element('linear')
-
-    @linear.setter
-    def linear(self, value):
-        self._add_child_element('linear', value)
-
-    @property
-    def angular(self):
-        return self._get_child_element('angular')
-
-    @angular.setter
-    def angular(self, value):
-        self._add_child_element('angular', value)
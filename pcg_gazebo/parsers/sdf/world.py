@@ -213,6 +213,32 @@ class World(XMLBase):
             self._add_child_element('light', light)
         self.children['light'][-1].name = name
 
+    def _extend_children(self, tag, elements):
+        # Append (name, element) pairs of models, lights or includes
+        # created by the caller. Unlike add_model and add_light, the
+        # elements are neither copied nor checked again. Models and
+        # lights with an already existing name are skipped
+        assert tag in ['model', 'light', 'include'], \
+            'Only models, lights and includes can be extended' \
+            ' in <world>, received={}'.format(tag)
+        elements = list(elements)
+        if len(elements) == 0:
+            return
+        children = self.children.setdefault(tag, list())
+        if tag == 'include':
+            children.extend(elem for _, elem in elements)
+            return
+        names = set(elem.name for elem in children)
+        for name, elem in elements:
+            if name in names:
+                print(
+                    '{} element with name {} already exists'.format(
+                        tag.capitalize(), name))
+                continue
+            elem.name = name
+            names.add(name)
+            children.append(elem)
+
     def get_light_by_name(self, name):
         if self.lights is None:
             return None
@@ -37,32 +37,28 @@ def get_all_sdf_config_element_classes():
     return output
 
 
-def create_sdf_config_element(tag, *args):
-    import sys
-    import inspect
-    from ..types import XMLBase
+_SDF_CONFIG_ELEMENT_TYPES = None
 
-    current_module = sys.modules[__name__]
-    for name, obj in inspect.getmembers(current_module):
-        if inspect.isclass(obj):
-            if issubclass(obj, XMLBase):
-                if tag == obj._NAME and obj._TYPE == 'sdf_config':
-                    return obj(*args)
-    return None
 
+def _get_sdf_config_element_types():
+    global _SDF_CONFIG_ELEMENT_TYPES
+    if _SDF_CONFIG_ELEMENT_TYPES is None:
+        element_types = dict()
+        for obj in get_all_sdf_config_element_classes():
+            element_types.setdefault(obj._NAME, obj)
+        _SDF_CONFIG_ELEMENT_TYPES = element_types
+    return _SDF_CONFIG_ELEMENT_TYPES
 
-def create_sdf_config_type(tag):
-    import sys
-    import inspect
-    from ..types import XMLBase
 
-    current_module = sys.modules[__name__]
-    for name, obj in inspect.getmembers(current_module):
-        if inspect.isclass(obj):
-            if issubclass(obj, XMLBase):
-                if tag == obj._NAME and obj._TYPE == 'sdf_config':
-                    return obj
-    return None
+def create_sdf_config_element(tag, *args):
+    obj = _get_sdf_config_element_types().get(tag, None)
+    if obj is None:
+        return None
+    return obj(*args)
+
+
+def create_sdf_config_type(tag):
+    return _get_sdf_config_element_types().get(tag, None)
 
 
 def is_sdf_config_element(obj):
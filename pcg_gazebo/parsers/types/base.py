@@ -15,8 +15,11 @@
 from __future__ import print_function
 from copy import deepcopy
 import collections
+import operator
 import numpy as np
 import sys
+from importlib import import_module
+from types import MappingProxyType
 from lxml import etree
 from lxml.etree import Element, SubElement
 from ...log import PCG_ROOT_LOGGER
@@ -24,12 +27,88 @@ from ...utils import is_scalar, is_boolean, is_array, \
     is_string, is_integer
 from .. import convert_from_string
 
-if sys.version_info[0] == 2:
-    # Importing a io.open compatible with Python 3.x
-    from io import open
 
-
-class XMLBase(object):
+def _child_element_property(tag):
+    """Return a `property` for the access to the child element `tag`.
+    The getter reads the children dict directly, the same as
+    `XMLBase._get_child_element` without a version, and the setter
+    forwards to `XMLBase._add_child_element`. The accessors are built
+    once per tag with the tag bound in their closure.
+    """
+
+    def fget(self):
+        return self.children.get(tag, None)
+
+    def fset(self, value):
+        self._add_child_element(tag, value)
+
+    return property(fget, fset, doc='Child element `{}`'.format(tag))
+
+
+# Converters used to validate the attributes with a type set in
+# `_ATTRIBUTES_TYPES`, an invalid input raises a TypeError or ValueError
+_ATTRIBUTES_VALIDATORS = {
+    int: operator.index,
+    float: float,
+    str: str
+}
+
+
+class _XMLMeta(type):
+    """Metaclass for the XML elements. For each single instance child
+    element in `_CHILDREN_CREATORS` that is not already defined by the
+    class or its bases, a property is installed on the class. Child
+    elements that can have multiple instances (`n_elems`
+    set as `+`) must still be exposed explicitly. The set of child
+    element tags is also stored as `_CHILDREN_NAMES` and the tags of
+    the non-optional child elements as `_REQUIRED_CHILDREN` and of the
+    child elements with multiple instances as `_MULT_CHILDREN`. The
+    validators of the attributes listed in `_ATTRIBUTES_TYPES` are
+    stored in `_ATTRIBUTES_VALIDATORS`.
+    The child element tags are interned so that the lookups in the
+    children dictionaries can compare the keys by identity. The
+    `_CHILDREN_CREATORS` of the class is made read-only, while the
+    creator specifications of each child remain editable.
+    """
+    def __new__(mcs, name, bases, namespace):
+        if '_CHILDREN_CREATORS' in namespace:
+            namespace['_CHILDREN_CREATORS'] = MappingProxyType(dict(
+                (sys.intern(tag), spec)
+                for tag, spec in namespace['_CHILDREN_CREATORS'].items()))
+        children = namespace.get('_CHILDREN_CREATORS', dict())
+        attributes = namespace.get('_ATTRIBUTES', dict())
+        for tag in children:
+            if children[tag].get('n_elems', None) == '+':
+                continue
+            if tag in namespace or tag in attributes:
+                continue
+            if any(hasattr(base, tag) for base in bases):
+                continue
+            namespace[tag] = _child_element_property(tag)
+        cls = super(_XMLMeta, mcs).__new__(mcs, name, bases, namespace)
+        # Set of child element tags, computed once per class for the
+        # membership tests
+        cls._CHILDREN_NAMES = frozenset(cls._CHILDREN_CREATORS)
+        # Tags of the child elements that are always created on reset
+        cls._REQUIRED_CHILDREN = tuple(
+            tag for tag in cls._CHILDREN_CREATORS
+            if not cls._CHILDREN_CREATORS[tag].get('optional', False))
+        cls._n_optional_elems = len(cls._CHILDREN_CREATORS) - \
+            len(cls._REQUIRED_CHILDREN)
+        # Tags of the child elements that can have multiple instances
+        cls._MULT_CHILDREN = frozenset(
+            tag for tag in cls._CHILDREN_CREATORS
+            if cls._CHILDREN_CREATORS[tag].get('n_elems', None) == '+')
+        # Map of child element names to their tags, only built on first
+        # use since the lazy creators must be imported to get the names
+        cls._CHILDREN_TAGS = None
+        cls._ATTRIBUTES_VALIDATORS = MappingProxyType(dict(
+            (tag, _ATTRIBUTES_VALIDATORS[cls._ATTRIBUTES_TYPES[tag]])
+            for tag in cls._ATTRIBUTES_TYPES))
+        return cls
+
+
+class XMLBase(object, metaclass=_XMLMeta):
     # Name of this XML block (e.g. joint)
     _NAME = ''
     _TYPE = ''
@@ -37,10 +116,29 @@ class XMLBase(object):
     _ATTRIBUTES = dict()
     _ATTRIBUTES_VERSIONS = dict()
     _ATTRIBUTES_MODES = dict()
+    _ATTRIBUTES_TYPES = dict()
     _MODES = list()
     _VALUE_OPTIONS = list()
     _FORMAT_VERSIONS = ['1.4', '1.5', '1.6']
     _VALUE_TYPE = ''
+    # Flag to indicate this element can have children that
+    # are not only in the children creator's list
+    _has_custom_elements = False
+
+    # Instance members, subclasses that do not add members can declare
+    # empty slots to have instances without __dict__
+    __slots__ = (
+        '_attributes',
+        'children',
+        '_value',
+        'sdf_version',
+        'options',
+        '_n_mult_child_counter',
+        '_mode',
+        '_description',
+        '_min_value',
+        '_max_value'
+    )
 
     def __init__(self, min_value=None, max_value=None):
         # Block attributes
@@ -60,15 +158,6 @@ class XMLBase(object):
         self._mode = None
         # String description
         self._description = ''
-        # Flag to indicate this element can have children that
-        # are not only in the children creator's list
-        self._has_custom_elements = False
-
-        self._n_optional_elems = 0
-        for tag in self._CHILDREN_CREATORS:
-            if 'optional' in self._CHILDREN_CREATORS[tag]:
-                if self._CHILDREN_CREATORS[tag]['optional']:
-                    self._n_optional_elems += 1
 
         # Store range limits for scalar value inputs
         if min_value is not None:
@@ -191,7 +280,7 @@ class XMLBase(object):
         return is_array(vec)
 
     def _is_string(self, value):
-        return is_string(value)
+        return isinstance(value, str)
 
     def _is_boolean(self, value):
         return is_boolean(value)
@@ -228,10 +317,21 @@ class XMLBase(object):
         else:
             return self.children[tag]
 
+    def _resolve_child_element_creator(self, tag):
+        creator = self._CHILDREN_CREATORS[tag]['creator']
+        if isinstance(creator, str):
+            # Lazy creator given as `module:class`, the module is only
+            # imported on first use and the class is cached back into
+            # the children creators
+            module_name, _, class_name = creator.partition(':')
+            creator = getattr(import_module(module_name), class_name)
+            self._CHILDREN_CREATORS[tag]['creator'] = creator
+        return creator
+
     def _get_child_element_name(self, tag):
-        if tag not in self._CHILDREN_CREATORS:
+        if tag not in self._CHILDREN_NAMES:
             return None
-        elif self._CHILDREN_CREATORS[tag]['creator'] is not None:
+        elif self._resolve_child_element_creator(tag) is not None:
             return self._CHILDREN_CREATORS[tag]['creator']._NAME
         else:
             # If child creator is given as None, it is interpreted
@@ -240,9 +340,9 @@ class XMLBase(object):
             return self._NAME
 
     def _get_child_element_creator(self, tag):
-        if tag not in self._CHILDREN_CREATORS:
+        if tag not in self._CHILDREN_NAMES:
             return None
-        elif self._CHILDREN_CREATORS[tag]['creator'] is not None:
+        elif self._resolve_child_element_creator(tag) is not None:
             return self._CHILDREN_CREATORS[tag]['creator']
         else:
             if self._TYPE == 'sdf':
@@ -257,7 +357,7 @@ class XMLBase(object):
 
     def _add_child_element(self, tag, value, use_as_if_duplicated=None):
         if not self._has_custom_elements:
-            assert tag in self._CHILDREN_CREATORS, \
+            assert tag in self._CHILDREN_NAMES, \
                 '<{}> child not found for <{}>, value=\n{}'.format(
                     tag, self._NAME, value)
         assert value is not None, \
@@ -279,21 +379,14 @@ class XMLBase(object):
                 setattr(self.children[tag], 'value', value)
         else:
             def _add_element(_obj):
-                has_mult = False
                 if not self._has_custom_elements:
-                    assert tag in self._CHILDREN_CREATORS, \
+                    assert tag in self._CHILDREN_NAMES, \
                         '{} element is not a child element from {}'.format(
                             tag, self._NAME)
-                    if 'n_elems' in self._CHILDREN_CREATORS[tag]:
-                        if self._CHILDREN_CREATORS[tag]['n_elems'] == '+':
-                            has_mult = True
+                    has_mult = tag in self._MULT_CHILDREN
                 else:
-                    if tag in self._CHILDREN_CREATORS:
-                        if 'n_elems' in self._CHILDREN_CREATORS[tag]:
-                            if self._CHILDREN_CREATORS[tag]['n_elems'] == '+':
-                                has_mult = True
-                    else:
-                        has_mult = True
+                    has_mult = tag in self._MULT_CHILDREN or \
+                        tag not in self._CHILDREN_NAMES
                 if has_mult:
                     if _obj._NAME not in self.children:
                         self.children[_obj._NAME] = list()
@@ -392,29 +485,18 @@ class XMLBase(object):
                                 setattr(obj, 'value', value[elem])
                         else:
                             if obj._NAME != 'empty':
-                                has_mult = False
                                 if not obj._has_custom_elements:
-                                    if elem not in obj._CHILDREN_CREATORS:
+                                    if elem not in obj._CHILDREN_NAMES:
                                         msg = '<{}> element is not a child' \
                                             ' element from <{}>, ' \
                                             'input={}'.format(
                                                 elem, obj._NAME, value[elem])
                                         PCG_ROOT_LOGGER.error(msg)
                                         continue
-                                    if 'n_elems' in \
-                                            obj._CHILDREN_CREATORS[elem]:
-                                        if obj._CHILDREN_CREATORS[elem][
-                                                'n_elems'] == '+':
-                                            has_mult = True
+                                    has_mult = elem in obj._MULT_CHILDREN
                                 else:
-                                    if elem in obj._CHILDREN_CREATORS:
-                                        if 'n_elems' in \
-                                                obj._CHILDREN_CREATORS[elem]:
-                                            if obj._CHILDREN_CREATORS[elem][
-                                                    'n_elems'] == '+':
-                                                has_mult = True
-                                    else:
-                                        has_mult = True
+                                    has_mult = elem in obj._MULT_CHILDREN or \
+                                        elem not in obj._CHILDREN_NAMES
 
                                 if isinstance(value[elem], list) and has_mult:
                                     for item in value[elem]:
@@ -486,23 +568,33 @@ class XMLBase(object):
         self.children = new_children
 
     def _get_child_element_mode(self, tag):
-        if tag not in self._CHILDREN_CREATORS:
+        if tag not in self._CHILDREN_NAMES:
             return None
         if 'mode' not in self._CHILDREN_CREATORS[tag]:
             return None
         return self._CHILDREN_CREATORS[tag]['mode']
 
+    def _get_children_tags(self):
+        # Children tags by element name, the first tag is used if
+        # more than one child element has the same name
+        cls = self.__class__
+        if cls._CHILDREN_TAGS is None:
+            children_tags = dict()
+            for tag in self._CHILDREN_CREATORS:
+                name = self._get_child_element_name(tag)
+                if name not in children_tags:
+                    children_tags[name] = tag
+            cls._CHILDREN_TAGS = children_tags
+        return cls._CHILDREN_TAGS
+
     def _child_has_multiple_elements(self, child_name):
-        for tag in self._CHILDREN_CREATORS:
-            if 'n_elems' not in self._CHILDREN_CREATORS[tag]:
-                continue
-            if self._get_child_element_name(tag) == child_name and \
-                    self._CHILDREN_CREATORS[tag]['n_elems'] == '+':
-                return True
-        return False
+        children_tags = self._get_children_tags()
+        if child_name not in children_tags:
+            return False
+        return children_tags[child_name] in self._MULT_CHILDREN
 
     def _child_sdf_versions(self, child_name):
-        if child_name in self._CHILDREN_CREATORS:
+        if child_name in self._CHILDREN_NAMES:
             if 'sdf_versions' in self._CHILDREN_CREATORS[child_name]:
                 return self._CHILDREN_CREATORS[child_name]['sdf_versions']
             else:
@@ -616,6 +708,13 @@ class XMLBase(object):
         assert self.is_valid(), 'Invalid scalar value'
         return '{}'.format(self._value)
 
+    def _get_formatted_value_as_str(self):
+        # Used by _to_xml, where the element was already validated.
+        # The types in this package override it to format the value
+        # without validating it again, other elements fall back to
+        # get_formatted_value_as_str
+        return self.get_formatted_value_as_str()
+
     def has_value(self):
         return self._value is not None
 
@@ -637,10 +736,7 @@ class XMLBase(object):
         elif self._has_custom_elements:
             return True
         else:
-            for tag in self._CHILDREN_CREATORS:
-                if name == self._get_child_element_name(tag):
-                    return True
-            return hasattr(self, name)
+            return name in self._get_children_tags() or hasattr(self, name)
 
     def reset(self, mode=None, with_optional_elements=False):
         if mode is not None and len(self._MODES) > 0:
@@ -662,11 +758,11 @@ class XMLBase(object):
 
         if len(self._CHILDREN_CREATORS) > 0:
             self.children = dict()
-            for child in self._CHILDREN_CREATORS:
-                if 'optional' in self._CHILDREN_CREATORS[child]:
-                    if self._CHILDREN_CREATORS[child]['optional'] and \
-                            not with_optional_elements:
-                        continue
+            if with_optional_elements:
+                children = self._CHILDREN_CREATORS
+            else:
+                children = self._REQUIRED_CHILDREN
+            for child in children:
                 # Test if element has a mode option and compare to the
                 # mode provided
                 if self._mode is not None:
@@ -681,15 +777,16 @@ class XMLBase(object):
                             continue
 
                 tag = self._get_child_element_name(child)
+                has_mult = child in self._MULT_CHILDREN
 
-                if 'n_elems' in self._CHILDREN_CREATORS[child]:
-                    if self._CHILDREN_CREATORS[child]['n_elems'] == '+':
-                        self.children[tag] = list()
+                if has_mult:
+                    self.children[tag] = list()
 
                 creator = self._get_child_element_creator(child)
                 if 'default' in self._CHILDREN_CREATORS[child]:
                     assert isinstance(
-                        self._CHILDREN_CREATORS[child]['default'], list)
+                        self._CHILDREN_CREATORS[child]['default'],
+                        (list, tuple))
                     obj = creator(*self._CHILDREN_CREATORS[child]['default'])
                 else:
                     obj = creator()
@@ -698,11 +795,8 @@ class XMLBase(object):
                         obj.xml_element_name != self.xml_element_name:
                     obj.reset(with_optional_elements=with_optional_elements)
 
-                if 'n_elems' in self._CHILDREN_CREATORS[child]:
-                    if self._CHILDREN_CREATORS[child]['n_elems'] == '+':
-                        self.children[tag].append(obj)
-                    else:
-                        self.children[tag] = obj
+                if has_mult:
+                    self.children[tag].append(obj)
                 else:
                     self.children[tag] = obj
 
@@ -717,9 +811,15 @@ class XMLBase(object):
         return att
 
     def to_xml(self, root=None, version='1.6'):
+        assert self.is_valid(), 'XML data is invalid'
+        return self._to_xml(root, version)
+
+    def _to_xml(self, root, version):
+        # The child elements are serialized without being validated
+        # again, is_valid() of the top element already checks the
+        # whole tree
         assert version in self._FORMAT_VERSIONS, \
             'Invalid version, options={}'.format(self._FORMAT_VERSIONS)
-        assert self.is_valid(), 'XML data is invalid'
 
         # Adding attributes
         att = self.get_attributes(version)
@@ -743,14 +843,14 @@ class XMLBase(object):
             self._value = None
 
         if self.has_value():
-            base.text = self.get_formatted_value_as_str()
+            base.text = self._get_formatted_value_as_str()
         else:
             if len(self.children) > 0:
                 for child_name in self.children:
                     if isinstance(self.children[child_name], list):
                         if self._child_exists_in_version(child_name, version):
                             for elem in self.children[child_name]:
-                                elem.to_xml(base, version)
+                                elem._to_xml(base, version)
                         else:
                             PCG_ROOT_LOGGER.info(
                                 '<{}> child element not available'
@@ -765,12 +865,12 @@ class XMLBase(object):
                             if hasattr(self, '_use_{}_as'.format(child_name)):
                                 if getattr(self, '_use_{}_as'.format(
                                         child_name)) == 'child':
-                                    self.children[child_name].to_xml(
+                                    self.children[child_name]._to_xml(
                                         base, version)
                                     continue
                         elif self._child_exists_in_version(
                                 child_name, version):
-                            self.children[child_name].to_xml(base, version)
+                            self.children[child_name]._to_xml(base, version)
                         else:
                             PCG_ROOT_LOGGER.info(
                                 '<{}> child element not available'
@@ -822,12 +922,12 @@ class XMLBase(object):
 
     def has_duplicated_child_and_attribute(self):
         for tag in self.attributes:
-            if tag in self._CHILDREN_CREATORS:
+            if tag in self._CHILDREN_NAMES:
                 return True
         return False
 
     def is_child_and_attribute(self, tag):
-        return tag in self.attributes and tag in self._CHILDREN_CREATORS
+        return tag in self.attributes and tag in self._CHILDREN_NAMES
 
     def from_dict(self, sdf_data, ignore_tags=list()):
         for tag in sdf_data:
@@ -860,10 +960,7 @@ class XMLBase(object):
     def export_xml(self, filename, version='1.6'):
         xml_root = self.to_xml(version=version)
         with open(filename, 'w+', encoding='utf-8') as output_xml:
-            if sys.version_info[0] == 2:
-                output_xml.write(u'<?xml version="1.0" ?>\n')
-            else:
-                output_xml.write('<?xml version="1.0" ?>\n')
+            output_xml.write('<?xml version="1.0" ?>\n')
             output_xml.write(
                 etree.tostring(xml_root, pretty_print=True,
                                encoding='utf-8').decode('utf-8'))
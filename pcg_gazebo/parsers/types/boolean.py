@@ -51,6 +51,9 @@ class XMLBoolean(XMLBase):
 
     def get_formatted_value_as_str(self):
         assert self.is_valid(), 'Invalid boolean'
+        return self._get_formatted_value_as_str()
+
+    def _get_formatted_value_as_str(self):
         return '{}'.format(int(self._value))
 
     def random(self):
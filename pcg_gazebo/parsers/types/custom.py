@@ -62,9 +62,7 @@ class XMLCustom(XMLBase):
         assert self.is_valid(), 'Invalid scalar value'
         return '{}'.format(self._value)
 
-    def to_xml(self, root=None, version='1.6'):
-        assert self.is_valid(), 'XML data is invalid'
-
+    def _to_xml(self, root, version):
         if root is None:
             base = Element(self._NAME, attrib=self.attributes)
         else:
@@ -69,6 +69,9 @@ class XMLInteger(XMLBase):
 
     def get_formatted_value_as_str(self):
         assert self.is_valid(), 'Invalid scalar value'
+        return self._get_formatted_value_as_str()
+
+    def _get_formatted_value_as_str(self):
         return format(self._value, 'd')
 
     def random(self):
@@ -64,6 +64,9 @@ class XMLScalar(XMLBase):
 
     def get_formatted_value_as_str(self):
         assert self.is_valid(), 'Invalid scalar value'
+        return self._get_formatted_value_as_str()
+
+    def _get_formatted_value_as_str(self):
         return '{}'.format(self._value)
 
     def random(self):
@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from . import XMLBase
-from ...utils import is_string, generate_random_string
+from ...utils import generate_random_string
 
 
 class XMLString(XMLBase):
@@ -27,9 +27,8 @@ class XMLString(XMLBase):
         self._default = default
 
     def _set_value(self, value):
-        assert is_string(value), \
-            '[{}] Input value must be string' \
-            ' or unicode, received={}, type={}'.format(
+        assert isinstance(value, str), \
+            '[{}] Input value must be string, received={}, type={}'.format(
                 self.xml_element_name, value, type(value))
         self._value = str(value)
 
@@ -45,6 +44,9 @@ class XMLString(XMLBase):
 
     def get_formatted_value_as_str(self):
         assert self.is_valid(), 'Invalid string'
+        return self._get_formatted_value_as_str()
+
+    def _get_formatted_value_as_str(self):
         return '{}'.format(str(self._value))
 
     def random(self):
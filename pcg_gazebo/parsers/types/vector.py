@@ -81,6 +81,9 @@ class XMLVector(XMLBase):
 
     def get_formatted_value_as_str(self):
         assert self.is_valid(), 'Invalid vector'
+        return self._get_formatted_value_as_str()
+
+    def _get_formatted_value_as_str(self):
         output_str = ' '.join(['{}'] * self._size)
         return output_str.format(*[format(x, 'n') for x in self._value])
 
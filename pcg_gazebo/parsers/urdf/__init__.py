@@ -59,6 +59,19 @@ def get_all_urdf_element_classes():
     return output
 
 
+_URDF_ELEMENT_TYPES = None
+
+
+def _get_urdf_element_types():
+    global _URDF_ELEMENT_TYPES
+    if _URDF_ELEMENT_TYPES is None:
+        element_types = dict()
+        for obj in get_all_urdf_element_classes():
+            element_types.setdefault(obj._NAME, obj)
+        _URDF_ELEMENT_TYPES = element_types
+    return _URDF_ELEMENT_TYPES
+
+
 def create_urdf_element(tag, *args):
     """URDF element factory.
 
@@ -72,16 +85,10 @@ def create_urdf_element(tag, *args):
     URDF element if `tag` refers to a valid URDF element.
     `None`, otherwise.
     """
-    import sys
-    import inspect
-    from ..types import XMLBase
-    current_module = sys.modules[__name__]
-    for name, obj in inspect.getmembers(current_module):
-        if inspect.isclass(obj):
-            if issubclass(obj, XMLBase):
-                if tag == obj._NAME and obj._TYPE == 'urdf':
-                    return obj(*args)
-    return None
+    obj = _get_urdf_element_types().get(tag, None)
+    if obj is None:
+        return None
+    return obj(*args)
 
 
 def create_urdf_type(tag):
@@ -95,16 +102,7 @@ def create_urdf_type(tag):
 
     URDF element type if `tag` is valid, `None` otherwise`.
     """
-    import sys
-    import inspect
-    from ..types import XMLBase
-    current_module = sys.modules[__name__]
-    for name, obj in inspect.getmembers(current_module):
-        if inspect.isclass(obj):
-            if issubclass(obj, XMLBase):
-                if tag == obj._NAME and obj._TYPE == 'urdf':
-                    return obj
-    return None
+    return _get_urdf_element_types().get(tag, None)
 
 
 def is_urdf_element(obj):
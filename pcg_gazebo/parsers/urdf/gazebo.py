@@ -62,9 +62,10 @@ class Gazebo(XMLBase):
 
     _MODES = ['none', 'link', 'joint', 'robot']
 
+    _has_custom_elements = True
+
     def __init__(self, mode='none', sdf_elements=dict()):
         XMLBase.__init__(self)
-        self._has_custom_elements = True
         self.reset(mode)
         for tag in sdf_elements:
             if not self._add_child_element(tag, sdf_elements[tag]):
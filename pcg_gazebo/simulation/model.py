@@ -14,7 +14,6 @@
 # limitations under the License.
 from __future__ import print_function
 import collections
-from copy import deepcopy
 import numpy as np
 from math import pi
 from .properties import Pose, Inertial, Footprint, Plugin, \
@@ -1669,15 +1668,12 @@ class SimulationModel(Entity):
             self.name, len(meshes)))
 
         bounds = None
-        for mesh in meshes:
-            if bounds is None:
-                bounds = deepcopy(mesh.bounds)
-            else:
-                cur_bounds = deepcopy(mesh.bounds)
-                for i in range(3):
-                    bounds[0, i] = min(bounds[0, i], cur_bounds[0, i])
-                for i in range(3):
-                    bounds[1, i] = max(bounds[1, i], cur_bounds[1, i])
+        if len(meshes) > 0:
+            # Reduce the (N, 2, 3) array of the mesh bounds at once
+            mesh_bounds = np.array([mesh.bounds for mesh in meshes])
+            bounds = np.array([
+                mesh_bounds[:, 0, :].min(axis=0),
+                mesh_bounds[:, 1, :].max(axis=0)])
         PCG_ROOT_LOGGER.info('Model <{}> bounds={}'.format(self.name, bounds))
         return bounds
 
@@ -14,13 +14,14 @@
 # limitations under the License.
 import collections
 from copy import deepcopy
+import numpy as np
 from .properties import Pose
 from .model import SimulationModel
 from .light import Light
 from .actor import Actor
 from .entity import Entity
 from ..log import PCG_ROOT_LOGGER
-from ..utils import has_string_pattern
+from ..utils import get_string_pattern_matcher
 
 
 class ModelGroup(Entity):
@@ -118,15 +119,11 @@ class ModelGroup(Entity):
         if model_name in self._models:
             self._models[model_name].set_as_ground_plane()
         else:
-            if '/' in model_name:
-                group_name = model_name.split('/')[0]
-                if group_name in self._models:
-                    return self._models[group_name].set_as_ground_plane(
-                        model_name)
-                else:
-                    return False
-            else:
-                return False
+            group_name, sep, sub_model_name = model_name.partition('/')
+            if sep and group_name in self._models:
+                return self._models[group_name].set_as_ground_plane(
+                    sub_model_name)
+            return False
         return True
 
     def reset_models(self):
@@ -388,15 +385,12 @@ class ModelGroup(Entity):
         meshes = self.get_meshes(mesh_type)
 
         bounds = None
-        for mesh in meshes:
-            if bounds is None:
-                bounds = deepcopy(mesh.bounds)
-            else:
-                cur_bounds = deepcopy(mesh.bounds)
-                for i in range(3):
-                    bounds[0, i] = min(bounds[0, i], cur_bounds[0, i])
-                for i in range(3):
-                    bounds[1, i] = max(bounds[1, i], cur_bounds[1, i])
+        if len(meshes) > 0:
+            # Reduce the (N, 2, 3) array of the mesh bounds at once
+            mesh_bounds = np.array([mesh.bounds for mesh in meshes])
+            bounds = np.array([
+                mesh_bounds[:, 0, :].min(axis=0),
+                mesh_bounds[:, 1, :].max(axis=0)])
         return bounds
 
     def create_scene(self, mesh_type='collision', add_pseudo_color=True,
@@ -409,7 +403,8 @@ class ModelGroup(Entity):
 
     def get_actor(self, name, with_group_prefix=True, use_group_pose=True):
         prefix = self.prefix if with_group_prefix else ''
-        if '/' not in name:
+        sub_group_name, sep, sub_name = name.partition('/')
+        if not sep:
             if name not in self._actors:
                 PCG_ROOT_LOGGER.warning('No actor {} found in group {}'.format(
                     name, self.name))
@@ -420,14 +415,13 @@ class ModelGroup(Entity):
                 output.pose = self._pose + output.pose
             output.name = prefix + output.name
         else:
-            sub_group_name = name.split('/')[0]
             if sub_group_name not in self._models:
                 PCG_ROOT_LOGGER.warning(
                     '<{}> is not a model group in <{}>'.format(
                         sub_group_name, self.name))
                 return None
             output = self._models[sub_group_name].get_actor(
-                name=name.replace(sub_group_name + '/', ''),
+                name=sub_name,
                 with_group_prefix=True)
             if use_group_pose:
                 output.pose = self._pose + output.pose
@@ -455,7 +449,8 @@ class ModelGroup(Entity):
 
     def get_model(self, name, with_group_prefix=True, use_group_pose=True):
         prefix = self.prefix if with_group_prefix else ''
-        if '/' not in name:
+        sub_group_name, sep, sub_name = name.partition('/')
+        if not sep:
             if name not in self._models:
                 PCG_ROOT_LOGGER.warning('No model {} found in group {}'.format(
                     name, self.name))
@@ -467,14 +462,13 @@ class ModelGroup(Entity):
                 output.pose = self._pose + output.pose
             output.name = prefix + output.name
         else:
-            sub_group_name = name.split('/')[0]
             if sub_group_name not in self._models:
                 PCG_ROOT_LOGGER.warning(
                     '<{}> is not a model group in <{}>'.format(
                         sub_group_name, self.name))
                 return None
             output = self._models[sub_group_name].get_model(
-                name=name.replace(sub_group_name + '/', ''),
+                name=sub_name,
                 with_group_prefix=True)
             if use_group_pose:
                 output.pose = self._pose + output.pose
@@ -490,14 +484,9 @@ class ModelGroup(Entity):
         if ignore_models is None:
             ignore_models = list()
 
-        def _is_ignored(name):
-            for item in ignore_models:
-                if has_string_pattern(name, item):
-                    return True
-            return False
-
+        is_ignored = get_string_pattern_matcher(ignore_models)
         for name in self._models:
-            if _is_ignored(name):
+            if is_ignored(name):
                 continue
             if isinstance(self._models[name], SimulationModel):
                 model = self.get_model(name, with_group_prefix, use_group_pose)
@@ -515,7 +504,8 @@ class ModelGroup(Entity):
     def get_light(self, name, with_group_prefix=True, use_group_pose=True):
         prefix = self.prefix if with_group_prefix else ''
         light = None
-        if '/' not in name:
+        sub_group_name, sep, sub_name = name.partition('/')
+        if not sep:
             if name not in self._lights:
                 PCG_ROOT_LOGGER.warning(
                     'No light model <{}> found in group {}'.format(
@@ -527,14 +517,13 @@ class ModelGroup(Entity):
                 light.pose = light.pose + self._pose
             light.name = prefix + light.name
         else:
-            sub_group_name = name.split('/')[0]
             if sub_group_name not in self._models:
                 PCG_ROOT_LOGGER.warning(
                     '<{}> is not a model group in <{}>'.format(
                         sub_group_name, self.name))
                 return None
             light = self._models[sub_group_name].get_light(
-                name=name.replace(sub_group_name + '/', ''),
+                name=sub_name,
                 with_group_prefix=True)
             if use_group_pose:
                 light.pose = light.pose + self._pose
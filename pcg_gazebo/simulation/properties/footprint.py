@@ -43,7 +43,7 @@ class Footprint(object):
 
     def get_footprint_polygon(self, offset=[0, 0], angle=0):
         if len(self._polygons) > 1:
-            footprint = ops.cascaded_union(self._polygons)
+            footprint = ops.unary_union(self._polygons)
         elif len(self._polygons) == 1:
             footprint = self._polygons[0]
         elif self._points is not None:
@@ -17,42 +17,41 @@ from ...parsers.sdf import create_sdf_element
 from ...parsers.sdf.format import Format
 
 
-class Image(object):
-    def __init__(self, image_width=100, image_height=100, image_format="R8G8B8"):
-        assert image_format in Format._VALUE_OPTIONS, \
-            f'Invalid image format type: {image_format}, options=' + str(Format._VALUE_OPTIONS)
-        assert isinstance(image_height, int), 'Image height must be an integer'
-        assert image_height > 0, 'Image height must be greater than zero'
-        assert isinstance(image_width, int), 'Image width must be an integer'
-        assert image_width > 0, 'Image width must be greater than zero'
+class _PositiveInteger(object):
+    """Descriptor for a positive integer property of `Image`, stored in
+    the slot named after the property with a leading underscore.
+    Floating point inputs are truncated to integers.
+    """
 
-        self._width = image_width
-        self._height = image_height
-        self._format = image_format
+    def __set_name__(self, owner, name):
+        self._name = name
+        self._slot = '_' + name
 
-    @property
-    def height(self):
-        return self._height
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(obj, self._slot)
 
-    @height.setter
-    def height(self, value):
+    def __set__(self, obj, value):
         if isinstance(value, float):
             value = int(value)
-        assert isinstance(value, int), 'Image height must be an integer'
-        assert value > 0, 'Image height must be greater than zero'
-        self._height = value
+        assert isinstance(value, int), \
+            'Image {} must be an integer'.format(self._name)
+        assert value > 0, \
+            'Image {} must be greater than zero'.format(self._name)
+        setattr(obj, self._slot, value)
 
-    @property
-    def width(self):
-        return self._width
 
-    @width.setter
-    def width(self, value):
-        if isinstance(value, float):
-            value = int(value)
-        assert isinstance(value, int), 'Image width must be an integer'
-        assert value > 0, 'Image width must be greater than zero'
-        self._width = value
+class Image(object):
+    __slots__ = ('_width', '_height', '_format')
+
+    width = _PositiveInteger()
+    height = _PositiveInteger()
+
+    def __init__(self, image_width=100, image_height=100, image_format="R8G8B8"):
+        self.format = image_format
+        self.height = image_height
+        self.width = image_width
 
     @property
     def format(self):
@@ -60,8 +59,10 @@ class Image(object):
 
     @format.setter
     def format(self, value):
-        assert value in Format._VALUE_OPTIONS, \
-            f'Invalid image format type: {image_format}, options=' + str(Format._VALUE_OPTIONS)
+        assert isinstance(value, str) and \
+            value in Format._VALUE_OPTIONS_SET, \
+            'Invalid image format type: {}, options={}'.format(
+                value, Format._VALUE_OPTIONS)
         self._format = value
 
     def to_sdf(self):
@@ -73,11 +74,13 @@ class Image(object):
 
     @staticmethod
     def from_sdf(sdf):
-        image = Image()
+        # The SDF values are read once and validated by the constructor.
+        # Integer SDF elements may hold integral floats
+        params = dict()
         if sdf.height is not None:
-            image.height = sdf.height.value
+            params['image_height'] = int(sdf.height.value)
         if sdf.width is not None:
-            image.width = sdf.width.value
+            params['image_width'] = int(sdf.width.value)
         if sdf.format is not None:
-            image.format = sdf.format.value
-        return image
+            params['image_format'] = sdf.format.value
+        return Image(**params)
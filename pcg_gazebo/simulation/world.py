@@ -14,23 +14,47 @@
 # limitations under the License.
 from __future__ import print_function
 import os
+import logging
 import numpy as np
 import trimesh
 import datetime
-from shapely.geometry import Polygon, MultiPolygon, MultiPoint
+from shapely.geometry import MultiPolygon, MultiPoint, box
 from shapely.ops import unary_union
+from shapely.prepared import prep
 from . import Light, SimulationModel, ModelGroup, Entity
 from .physics import Physics, ODE, Simbody, Bullet
-from .properties import Plugin, Pose, Footprint
+from .properties import Plugin, Pose
 from ..parsers import parse_xacro, parse_sdf
 from ..parsers.sdf import create_sdf_element
 from ..log import PCG_ROOT_LOGGER
 from ..utils import is_string, is_array, get_random_point_from_shape, \
-    has_string_pattern
+    get_string_pattern_matcher
 from ..generators.occupancy import generate_occupancy_grid
 from .. import random
 
 
+_COLLISION_CHECKER_CLASS = None
+_CREATE_SCENE = None
+
+
+def _get_collision_checker_class():
+    # The generators and visualization modules are imported on first use,
+    # the generators package imports this module
+    global _COLLISION_CHECKER_CLASS
+    if _COLLISION_CHECKER_CLASS is None:
+        from ..generators import CollisionChecker
+        _COLLISION_CHECKER_CLASS = CollisionChecker
+    return _COLLISION_CHECKER_CLASS
+
+
+def _get_create_scene():
+    global _CREATE_SCENE
+    if _CREATE_SCENE is None:
+        from ..visualization import create_scene
+        _CREATE_SCENE = create_scene
+    return _CREATE_SCENE
+
+
 class World(Entity):
     """Abstraction of Gazebo's world description. This class
     contains the settings configuring the world's
@@ -56,18 +80,18 @@ class World(Entity):
 
     def __init__(self, name='default', gravity=[0, 0, -9.8], engine='ode'):
         super(World, self).__init__(name=name)
-        assert isinstance(gravity, list)
-        assert len(gravity) == 3
-        for elem in gravity:
-            assert isinstance(elem, float) or isinstance(elem, int)
         assert engine in self._PHYSICS_ENGINES
 
-        self._gravity = gravity
+        self.gravity = gravity
         self._name = name
         self._engine = engine
         self._physics = None
         self._model_groups = dict()
         self._plugins = dict()
+        # Next counter suffix to try for duplicated model group and
+        # plugin names
+        self._model_group_suffixes = dict()
+        self._plugin_suffixes = dict()
         self._spherical_coordinates = None
         self._wind = None
         self._gui = None
@@ -139,44 +163,44 @@ class World(Entity):
 
     @gravity.setter
     def gravity(self, value):
-        assert isinstance(value, list)
-        assert len(value) == 3
-        for elem in value:
-            assert isinstance(elem, float) or isinstance(elem, int)
-        self._gravity = value
+        assert isinstance(value, (list, tuple)) and len(value) == 3, \
+            'Gravity must be a vector with 3 elements, received={}'.format(
+                value)
+        assert all(isinstance(elem, (float, int)) for elem in value), \
+            'Gravity vector elements must be numeric, received={}'.format(
+                value)
+        # Stored as a copy, the default argument list is shared
+        # between all instances
+        self._gravity = [float(elem) for elem in value]
 
     @property
     def models(self):
         """`dict`: Models"""
         models = dict()
-        for name in self._model_groups:
-            models.update(
-                self._model_groups[name].get_models(
-                    with_group_prefix=True))
+        for group in self._model_groups.values():
+            models.update(group.get_models(with_group_prefix=True))
         return models
 
     @property
     def lights(self):
         """`dict`: Lights"""
         lights = dict()
-        for name in self._model_groups:
-            lights.update(
-                self._model_groups[name].get_lights(
-                    with_group_prefix=True))
+        for group in self._model_groups.values():
+            lights.update(group.get_lights(with_group_prefix=True))
         return lights
 
     @property
     def n_models(self):
         n_models = 0
-        for tag in self._model_groups:
-            n_models += self._model_groups[tag].n_models
+        for group in self._model_groups.values():
+            n_models += group.n_models
         return n_models
 
     @property
     def n_lights(self):
         n_lights = 0
-        for tag in self._model_groups:
-            n_lights += self._model_groups[tag].n_lights
+        for group in self._model_groups.values():
+            n_lights += group.n_lights
         return n_lights
 
     @property
@@ -188,21 +212,30 @@ class World(Entity):
         world = World.from_sdf(self.to_sdf())
         return world
 
+    @staticmethod
+    def _get_unique_name(tag, names, suffixes):
+        # Add counter suffix `_i` to elements with an existing name, the
+        # next suffix to try is stored per name in `suffixes` so that
+        # adding many duplicates does not probe all the previous ones
+        if tag not in names:
+            return tag
+        i = suffixes.get(tag, 1)
+        while '{}_{}'.format(tag, i) in names:
+            i += 1
+        suffixes[tag] = i + 1
+        return '{}_{}'.format(tag, i)
+
     def set_as_ground_plane(self, model_name):
-        if '/' not in model_name and 'default' in self._model_groups:
-            return self._model_groups['default'].set_as_ground_plane(
-                model_name)
-        else:
-            group_name = model_name.split('/')[0]
-            sub_model_name = model_name.replace('{}/'.format('group_name'), '')
-            if group_name not in self._model_groups:
-                PCG_ROOT_LOGGER.error(
-                    'Model group <{}> for model <{}> does not exist'.format(
-                        group_name, model_name))
-                return False
-            return self._model_groups[group_name].set_as_ground_plane(
-                sub_model_name)
-        return True
+        group_name, sep, sub_model_name = model_name.partition('/')
+        if not sep:
+            group_name = 'default'
+        group = self._model_groups.get(group_name, None)
+        if group is None:
+            PCG_ROOT_LOGGER.error(
+                'Model group <{}> for model <{}> does not exist'.format(
+                    group_name, model_name))
+            return False
+        return group.set_as_ground_plane(sub_model_name)
 
     def reset_physics(self, engine='ode', *args, **kwargs):
         """Reset the physics engine to its default configuration.
@@ -224,8 +257,8 @@ class World(Entity):
 
     def reset_models(self):
         """Reset the list of models."""
-        for name in self._model_groups:
-            self._model_groups[name].reset_models()
+        for group in self._model_groups.values():
+            group.reset_models()
         PCG_ROOT_LOGGER.info('Models groups were resetted')
 
     def create_model_group(self, name, pose=[0, 0, 0, 0, 0, 0]):
@@ -273,23 +306,14 @@ class World(Entity):
         return self._model_groups[group].add_model(tag, model)
 
     def add_model_group(self, group, tag=None):
-        from copy import deepcopy
         if tag is None:
-            tag = deepcopy(group.name)
-
-        if tag in self._model_groups:
-            # Add counter suffix to add models with same name
-            i = 0
-            new_name = '{}'.format(tag)
-            while new_name in self._model_groups:
-                i += 1
-                new_name = '{}_{}'.format(tag, i)
-            name = new_name
-        else:
-            name = tag
+            tag = group.name
+
+        name = self._get_unique_name(
+            tag, self._model_groups, self._model_group_suffixes)
 
         self._model_groups[name] = group
-        self._model_groups[name].name = name
+        group.name = name
         return True
 
     def rm_model(self, tag, group='default'):
@@ -323,8 +347,8 @@ class World(Entity):
         `bool`: `True`, if model exists, `False`, otherwise.
         """
         if group is None:
-            for name in self._model_groups:
-                if self._model_groups[name].model_exists(tag):
+            for group in self._model_groups.values():
+                if group.model_exists(tag):
                     return True
             return False
         if group not in self._model_groups:
@@ -338,12 +362,12 @@ class World(Entity):
             if 'default' in self._model_groups:
                 if self._model_groups['default'].model_exists(tag):
                     return self._model_groups['default'].get_model(tag)
-            if '/' in tag:
-                group_name = tag.split('/')[0]
-                if group_name not in self._model_groups:
+            group_name, sep, model_name = tag.partition('/')
+            if sep:
+                group = self._model_groups.get(group_name, None)
+                if group is None:
                     return None
-                return self._model_groups[group_name].get_model(
-                    tag.replace('{}/'.format(group_name), ''))
+                return group.get_model(model_name)
         else:
             if group not in self._model_groups:
                 PCG_ROOT_LOGGER.error(
@@ -362,16 +386,8 @@ class World(Entity):
         * `plugin` (*type:* `pcg_gazebo.parsers.sdf.Plugin` or
         `pcg_gazebo.simulation.properties.Plugin`): Plugin description.
         """
-        if self.plugin_exists(tag):
-            # Add counter suffix to add plugins with same name
-            i = 0
-            new_name = '{}'.format(tag)
-            while self.plugin_exists(new_name):
-                i += 1
-                new_name = '{}_{}'.format(tag, i)
-            name = new_name
-        else:
-            name = tag
+        name = self._get_unique_name(
+            tag, self._plugins, self._plugin_suffixes)
 
         if not isinstance(plugin, Plugin):
             plugin = Plugin.from_sdf(plugin)
@@ -493,22 +509,17 @@ class World(Entity):
         if self._physics is not None:
             world.physics = self._physics.to_sdf('physics')
 
-        for group_name in self._model_groups:
-            sdf_models, sdf_lights, sdf_includes = \
-                self._model_groups[group_name].to_sdf()
-
-            for name in sdf_models:
-                world.add_model(name, sdf_models[name])
-
-            for name in sdf_lights:
-                world.add_light(name, sdf_lights[name])
-
-            for name in sdf_includes:
-                world.add_include(include=sdf_includes[name])
+        # The elements are created for this world only, so they are
+        # appended without the copies made by add_model and add_light
+        for group in self._model_groups.values():
+            sdf_models, sdf_lights, sdf_includes = group.to_sdf()
+            world._extend_children('model', sdf_models.items())
+            world._extend_children('light', sdf_lights.items())
+            world._extend_children('include', sdf_includes.items())
 
         # TODO: Include plugins and actors on the exported file
-        for tag in self._plugins:
-            world.add_plugin(tag, self._plugins[tag].to_sdf())
+        for tag, plugin in self._plugins.items():
+            world.add_plugin(tag, plugin.to_sdf())
 
         if self._wind is not None:
             world.wind = self._wind
@@ -586,12 +597,9 @@ class World(Entity):
         world = World()
         if sdf_tree.models is not None:
             for model in sdf_tree.models:
-                if '/' in model.name:
-                    group_name = model.name.split('/')[0]
-                    model_name = model.name.replace(group_name + '/', '')
-                else:
-                    group_name = 'default'
-                    model_name = model.name
+                group_name, sep, model_name = model.name.partition('/')
+                if not sep:
+                    group_name, model_name = 'default', model.name
                 world.add_model(
                     model_name,
                     SimulationModel.from_sdf(model),
@@ -599,12 +607,9 @@ class World(Entity):
 
         if sdf_tree.lights is not None:
             for light in sdf_tree.lights:
-                if '/' in light.name:
-                    group_name = light.name.split('/')[0]
-                    light_name = light.name.replace(group_name + '/', '')
-                else:
-                    group_name = 'default'
-                    light_name = light.name
+                group_name, sep, light_name = light.name.partition('/')
+                if not sep:
+                    group_name, light_name = 'default', light.name
                 world.add_light(
                     light_name,
                     Light.from_sdf(light),
@@ -618,13 +623,10 @@ class World(Entity):
             for inc in sdf_tree.includes:
                 try:
                     if inc.name is not None:
-                        if '/' in inc.name.value:
-                            group_name = inc.name.value.split('/')[0]
-                            inc_name = inc.name.value.replace(
-                                group_name + '/', '')
-                        else:
-                            group_name = 'default'
-                            inc_name = inc.name.value
+                        group_name, sep, inc_name = \
+                            inc.name.value.partition('/')
+                        if not sep:
+                            group_name, inc_name = 'default', inc.name.value
                         inc.name.value = inc_name
                     else:
                         group_name = 'default'
@@ -675,51 +677,40 @@ class World(Entity):
         * `add_pseudo_color` (*type:* `bool`, *default:* `True`): If `True`,
         set each mesh with a pseudo-color.
         """
-        from ..visualization import create_scene
         if ignore_models is None:
             ignore_models = list()
 
-        def _is_ignored(name):
-            for item in ignore_models:
-                if has_string_pattern(name, item):
-                    return True
-            return False
-
-        return create_scene(
-            [self.models[tag] for tag in self.models if not _is_ignored(tag)],
+        is_ignored = get_string_pattern_matcher(ignore_models)
+        models = self.models
+        return _get_create_scene()(
+            [model for tag, model in models.items() if not is_ignored(tag)],
             mesh_type,
             add_pseudo_color,
             add_axis=add_axis)
 
     def to_model_group(self, include_models=None, ignore_models=None):
-        from . import ModelGroup
         group = ModelGroup()
 
+        models = self.models
+        lights = self.lights
         if include_models is None:
-            include_models = list(self.models.keys()) + \
-                list(self.lights.keys())
+            # All models and lights are included
+            def is_included(name):
+                return True
+        else:
+            is_included = get_string_pattern_matcher(include_models)
 
         if ignore_models is None:
             ignore_models = list()
 
-        def _is_included(name):
-            for item in include_models:
-                if has_string_pattern(name, item):
-                    return True
-            return False
-
-        def _is_ignored(name):
-            for item in ignore_models:
-                if has_string_pattern(name, item):
-                    return True
-            return False
-        for tag in self.models:
-            if _is_included(tag) and not _is_ignored(tag):
-                group.add_model(tag, self.models[tag])
+        is_ignored = get_string_pattern_matcher(ignore_models)
+        for tag, model in models.items():
+            if is_included(tag) and not is_ignored(tag):
+                group.add_model(tag, model)
 
-        for tag in self.lights:
-            if _is_included(tag) and not _is_ignored(tag):
-                group.add_light(tag, self.lights[tag])
+        for tag, light in lights.items():
+            if is_included(tag) and not is_ignored(tag):
+                group.add_light(tag, light)
 
         return group
 
@@ -937,7 +928,6 @@ class World(Entity):
     def is_free_space(self, model, pose, ignore_models=None,
                       static_collision_checker=None,
                       return_collision_checker=False):
-        from ..generators import CollisionChecker
         test_model = None
         if is_string(model):
             test_model = SimulationModel.from_gazebo_model(model)
@@ -950,26 +940,37 @@ class World(Entity):
                 ' ROS paths, or a SimulationModel object, received={}'.format(
                     type(model)))
 
+        return self._check_free_space(
+            test_model, pose, ignore_models, static_collision_checker,
+            return_collision_checker)
+
+    def _check_free_space(self, test_model, pose, ignore_models=None,
+                          static_collision_checker=None,
+                          return_collision_checker=False):
+        # Same as is_free_space, but the pose of the model is overwritten
+        # instead of testing a copy of it
         if ignore_models is None:
             ignore_models = list()
 
-        PCG_ROOT_LOGGER.info(
-            'Check if model <{}> is in free space, pose={}'.format(
-                model.name, pose.to_sdf()))
+        if PCG_ROOT_LOGGER.isEnabledFor(logging.INFO):
+            PCG_ROOT_LOGGER.info(
+                'Check if model <{}> is in free space, pose={}'.format(
+                    test_model.name, pose.to_sdf()))
         test_model.pose = pose
 
         if static_collision_checker is None:
             PCG_ROOT_LOGGER.info('Creating a collision checker')
-            collision_checker = CollisionChecker()
+            collision_checker = _get_collision_checker_class()()
 
             # Add models to the collision checker
+            models = self.models
             PCG_ROOT_LOGGER.info(
                 'Populating collision checker, # models={}'.format(
-                    len(self.models)))
-            for tag in self.models:
-                for item in ignore_models:
-                    if not has_string_pattern(self.models[tag].name, item):
-                        collision_checker.add_model(self.models[tag])
+                    len(models)))
+            is_ignored = get_string_pattern_matcher(ignore_models)
+            for tag in models:
+                if not is_ignored(models[tag].name):
+                    collision_checker.add_model(models[tag])
             no_collision = \
                 not collision_checker.check_collision_with_current_scene(
                     test_model)
@@ -985,20 +986,21 @@ class World(Entity):
             return no_collision
 
     def get_bounds(self, mesh_type='collision'):
-        from copy import deepcopy
+        return self._get_bounds(self.models, mesh_type)
+
+    def _get_bounds(self, models, mesh_type='collision'):
+        # Bounds of the models already retrieved from the model groups
         bounds = None
         PCG_ROOT_LOGGER.info('Compute world <{}> bounds'.format(self.name))
-        for tag in self.models:
-            model_bounds = self.models[tag].get_bounds()
-            if bounds is None:
-                bounds = deepcopy(model_bounds)
-            else:
-                cur_bounds = deepcopy(model_bounds)
-                for i in range(3):
-                    bounds[0, i] = min(bounds[0, i], cur_bounds[0, i])
-                for i in range(3):
-                    bounds[1, i] = max(bounds[1, i], cur_bounds[1, i])
-        PCG_ROOT_LOGGER.info('World <{}> bounds={}'.format(self.name, bounds))
+        model_bounds = [
+            model.get_bounds(mesh_type) for model in models.values()]
+        model_bounds = [item for item in model_bounds if item is not None]
+        if len(model_bounds) > 0:
+            model_bounds = np.array(model_bounds)
+            bounds = np.array([
+                model_bounds[:, 0, :].min(axis=0),
+                model_bounds[:, 1, :].max(axis=0)])
+        PCG_ROOT_LOGGER.info('World <%s> bounds=%s', self.name, bounds)
         return bounds
 
     def get_free_space_polygon(
@@ -1028,16 +1030,15 @@ class World(Entity):
                 'For an empty world, the y_limits cannot be None'
             assert y_limits[0] < y_limits[1], \
                 'Invalid Y limits, value={}'.format(y_limits)
-            return Polygon(
-                [
-                    [x_limits[0], y_limits[0]],
-                    [x_limits[0], y_limits[1]],
-                    [x_limits[1], y_limits[1]],
-                    [x_limits[1], y_limits[0]],
-                    [x_limits[0], y_limits[0]]]
-            )
-
-        bounds = self.get_bounds()
+            return box(
+                x_limits[0], y_limits[0], x_limits[1], y_limits[1], ccw=False)
+
+        # The same model copies are used for the bounds and the
+        # occupancy grid
+        models = self.models
+        # The model bounds are only needed for the missing limits
+        if x_limits is None or y_limits is None:
+            bounds = self._get_bounds(models)
         if x_limits is not None:
             assert is_array(x_limits), 'X limits must be an array'
             assert x_limits[0] < x_limits[1], \
@@ -1052,35 +1053,20 @@ class World(Entity):
         else:
             y_limits = [bounds[0, 1], bounds[1, 1]]
 
-        free_space_polygon = Polygon(
-            [
-                [x_limits[0], y_limits[0]],
-                [x_limits[0], y_limits[1]],
-                [x_limits[1], y_limits[1]],
-                [x_limits[1], y_limits[0]],
-                [x_limits[0], y_limits[0]]]
-        )
+        free_space_polygon = box(
+            x_limits[0], y_limits[0], x_limits[1], y_limits[1], ccw=False)
 
         if len(ground_plane_models) == 0:
-            for tag in self.models:
-                if self.models[tag].is_ground_plane:
-                    is_ignored = False
-                    for item in ignore_models:
-                        if has_string_pattern(self.models[tag].name, item):
-                            is_ignored = True
-                            break
-                    if not is_ignored:
-                        ground_plane_models.append(tag)
-
-        filtered_models = dict()
-        for tag in self.models:
-            if self.models[tag].is_ground_plane:
-                filtered_models[tag] = self.models[tag]
-            else:
-                for item in ground_plane_models:
-                    if has_string_pattern(self.models[tag].name, item):
-                        filtered_models[tag] = self.models[tag]
-                        break
+            is_ignored = get_string_pattern_matcher(ignore_models)
+            ground_plane_models = [
+                tag for tag, model in models.items()
+                if model.is_ground_plane and not is_ignored(model.name)]
+
+        is_ground_plane_model = get_string_pattern_matcher(
+            ground_plane_models)
+        filtered_models = {
+            tag: model for tag, model in models.items()
+            if model.is_ground_plane or is_ground_plane_model(model.name)}
 
         if len(filtered_models) == 0:
             return free_space_polygon
@@ -1101,12 +1087,7 @@ class World(Entity):
             return free_space_polygon
 
         static_footprints = unary_union(
-            [occupancy_output['static'][tag]
-             for tag in occupancy_output['static']])
-
-        dynamic_footprints = unary_union(
-            [occupancy_output['non_static'][tag]
-             for tag in occupancy_output['non_static']])
+            list(occupancy_output['static'].values()))
 
         if occupancy_output['ground_plane'] is not None:
             diff_st_gp = occupancy_output['ground_plane'].difference(
@@ -1118,19 +1099,19 @@ class World(Entity):
                 free_space_polygon = free_space_polygon.intersection(
                     occupancy_output['ground_plane'])
 
+        # Subtract all footprints with a single overlay of the free space,
+        # the non-static footprints are merged into the static union
         free_space_polygon = free_space_polygon.difference(
-            static_footprints)
-
-        free_space_polygon = free_space_polygon.difference(
-            dynamic_footprints)
+            unary_union(
+                [static_footprints] +
+                list(occupancy_output['non_static'].values())))
 
         free_space_polygon = free_space_polygon.buffer(-1e-3)
         # Remove small free spaces
         if isinstance(free_space_polygon, MultiPolygon):
-            for geo in free_space_polygon.geoms:
-                if geo.area <= free_space_min_area:
-                    free_space_polygon = free_space_polygon.difference(
-                        geo.buffer(1e-5))
+            free_space_polygon = MultiPolygon(
+                [geo for geo in free_space_polygon.geoms
+                 if geo.area > free_space_min_area])
         free_space_polygon = free_space_polygon.simplify(tolerance=1e-4)
         free_space_polygon = free_space_polygon.buffer(1e-3)
 
@@ -1154,7 +1135,7 @@ class World(Entity):
             show_preview_2d=False,
             show_preview_3d=False,
             verbose=True,
-            max_num_tests=None):
+            max_num_tests=1000):
         assert n_spots > 0, 'Number of free spots must be greater than zero'
         if max_num_tests is not None:
             assert max_num_tests > 0, \
@@ -1231,11 +1212,10 @@ class World(Entity):
 
         PCG_ROOT_LOGGER.info('Active DoFs={}'.format(active_dofs))
 
-        footprints = test_model.get_footprint()
-        combined_footprint = Footprint()
-        for tag in footprints:
-            combined_footprint.add_polygon(footprints[tag])
-        model_footprint = combined_footprint.get_footprint_polygon()
+        # Union of the footprints of all the model's links, without the
+        # offset and heading transforms of a Footprint property
+        model_footprint = unary_union(
+            list(test_model.get_footprint().values()))
 
         if model_footprint.is_empty:
             PCG_ROOT_LOGGER.error('Model provided has no valid footprint')
@@ -1257,18 +1237,27 @@ class World(Entity):
                     x_limits, y_limits))
             return None
 
-        PCG_ROOT_LOGGER.info('Area of free space polygon={}'.format(
-            free_space_polygon.area))
+        PCG_ROOT_LOGGER.info(
+            'Area of free space polygon=%s', free_space_polygon.area)
 
         if model_footprint.area >= free_space_polygon.area:
             PCG_ROOT_LOGGER.error(
                 'Model is too big for the available free space')
             return None
 
+        # Prepare the polygon once for the point sampling tests
+        prepared_free_space_polygon = prep(free_space_polygon)
+        # Model copy moved to each tested pose, test_model keeps the
+        # original pose offset
+        candidate_model = test_model.copy()
+        model_pose = test_model.pose
+
         poses = list()
         collision_checker = None
         n_tries = 0
         while len(poses) < n_spots:
+            # Stop after max_num_tests consecutive candidates in
+            # collision, no limit is applied if it is None
             if max_num_tests is not None:
                 if n_tries >= max_num_tests:
                     PCG_ROOT_LOGGER.warning(
@@ -1276,16 +1265,13 @@ class World(Entity):
                         ' # spots found={}'.format(
                             max_num_tests, len(poses)))
                     break
-            pose = Pose()
             # Generate random point
-            xy = get_random_point_from_shape(free_space_polygon)
-
-            pose.x = xy[0]
-            pose.y = xy[1]
+            xy = get_random_point_from_shape(prepared_free_space_polygon)
 
             # Computing Z component
+            z = 0
             if z_limits is not None and 'z' in active_dofs:
-                pose.z = random.rand() * (z_limits[1] - z_limits[0]) \
+                z = random.rand() * (z_limits[1] - z_limits[0]) \
                     + z_limits[0]
 
             # Computing roll, pitch and yaw
@@ -1305,36 +1291,41 @@ class World(Entity):
                 yaw = random.rand() * (yaw_limits[1] - yaw_limits[0]) \
                     + yaw_limits[0]
 
-            pose.rpy = [roll, pitch, yaw]
-
-            # Add the model pose to the computed pose
-            pose = pose + test_model.pose
+            # Add the model pose to the computed pose, the candidate pose
+            # is created once all its components are sampled
+            pose = Pose(pos=[xy[0], xy[1], z], rot=[roll, pitch, yaw]) + \
+                model_pose
 
-            PCG_ROOT_LOGGER.info('Testing pose={}'.format(pose.to_sdf()))
+            # The pose is only converted to SDF if the message is logged
+            if PCG_ROOT_LOGGER.isEnabledFor(logging.INFO):
+                PCG_ROOT_LOGGER.info('Testing pose={}'.format(pose.to_sdf()))
 
             if collision_checker is None:
                 is_free_space, collision_checker = \
-                    self.is_free_space(
-                        test_model,
+                    self._check_free_space(
+                        candidate_model,
                         pose,
                         ignore_models=ignore_models,
                         return_collision_checker=True)
             else:
                 is_free_space = \
-                    self.is_free_space(
-                        test_model,
+                    self._check_free_space(
+                        candidate_model,
                         pose,
                         ignore_models=ignore_models,
                         static_collision_checker=collision_checker,
                         return_collision_checker=True)
             if is_free_space:
-                PCG_ROOT_LOGGER.info('Storing free space pose={}'.format(
-                    pose.to_sdf()))
+                if PCG_ROOT_LOGGER.isEnabledFor(logging.INFO):
+                    PCG_ROOT_LOGGER.info('Storing free space pose={}'.format(
+                        pose.to_sdf()))
                 poses.append(pose)
                 n_tries = 0
             else:
-                PCG_ROOT_LOGGER.info('Collision detected for pose={}'.format(
-                    pose.to_sdf()))
+                if PCG_ROOT_LOGGER.isEnabledFor(logging.INFO):
+                    PCG_ROOT_LOGGER.info(
+                        'Collision detected for pose={}'.format(
+                            pose.to_sdf()))
                 n_tries += 1
 
         if show_preview_2d:
@@ -1407,12 +1398,13 @@ class World(Entity):
             PCG_ROOT_LOGGER.error('Invalid world filename={}'.format(filename))
             return None
 
-        for tag in self.models:
-            if self.models[tag].has_mesh and \
+        models = self.models
+        for tag in models:
+            if models[tag].has_mesh and \
                     not is_gazebo_model(
-                        self.models[tag].source_model_name,
+                        models[tag].source_model_name,
                         include_custom_paths=True):
-                self.models[tag].to_gazebo_model(
+                models[tag].to_gazebo_model(
                     sdf_version=sdf_version,
                     output_dir=models_output_dir,
                     overwrite=overwrite,
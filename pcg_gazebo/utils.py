@@ -21,6 +21,7 @@ import string
 import os
 import re
 import yaml
+from functools import lru_cache
 from jinja2 import FileSystemLoader, Environment, \
     BaseLoader, TemplateNotFound
 try:
@@ -366,11 +367,7 @@ def is_string(obj):
 
     `True`, if `obj` is a string.
     """
-    import sys
-    if sys.version_info.major == 2:
-        return isinstance(obj, (str, unicode))  # noqa: F821
-    else:
-        return isinstance(obj, str)
+    return isinstance(obj, str)
 
 
 def is_scalar(obj):
@@ -440,7 +437,13 @@ def is_array(obj):
 
 def get_random_point_from_shape(geo):
     from shapely.geometry import Point
-    min_x, min_y, max_x, max_y = geo.bounds
+    from shapely.prepared import PreparedGeometry
+    # A prepared geometry can be provided by callers sampling the same
+    # shape repeatedly, the bounds are taken from its source geometry
+    if isinstance(geo, PreparedGeometry):
+        min_x, min_y, max_x, max_y = geo.context.bounds
+    else:
+        min_x, min_y, max_x, max_y = geo.bounds
     pnt = [
         random.uniform(min_x, max_x),
         random.uniform(min_y, max_y)
@@ -472,6 +475,52 @@ def has_string_pattern(input_str, pattern):
     return False
 
 
+@lru_cache(maxsize=128)
+def _compile_string_patterns(patterns):
+    # Patterns without wildcards are matched by a set lookup, an
+    # alternation of many literal names is tested one by one by re
+    literals = frozenset(pattern for pattern in patterns if '*' not in pattern)
+    expressions = list()
+    for pattern in patterns:
+        if '*' not in pattern:
+            continue
+        text = re.escape(pattern.replace('*', ''))
+        if pattern.startswith('*') and pattern.endswith('*'):
+            expressions.append('.*' + text + '.*')
+        elif pattern.startswith('*'):
+            expressions.append('.*' + text)
+        elif pattern.endswith('*'):
+            expressions.append(text + '.*')
+        # Patterns with a wildcard only in the middle never match in
+        # has_string_pattern
+    if len(expressions) == 0:
+        return literals, None
+    return literals, re.compile('|'.join(expressions), re.DOTALL)
+
+
+def get_string_pattern_matcher(patterns):
+    """Return a function that tests if a string matches any of the
+    input patterns, with the same rules as `has_string_pattern`. Names
+    without wildcards are tested with a set lookup and the wildcard
+    patterns are compiled into one regular expression, both cached for
+    repeated sets of patterns.
+
+    > *Input arguments*
+
+    * `patterns` (*type:* `list`): List of string patterns.
+
+    > *Returns*
+
+    Function that receives a string and returns `True` if it matches
+    any of the patterns.
+    """
+    literals, regex = _compile_string_patterns(tuple(patterns))
+    if regex is None:
+        return lambda input_str: input_str in literals
+    return lambda input_str: input_str in literals or \
+        regex.fullmatch(input_str) is not None
+
+
 def get_ros_path(pkg):
     if not ROS1_AVAILABLE and not ROS2_AVAILABLE:
         return None
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import os
+import platform
 import sys
 from setuptools import setup
 
@@ -29,7 +30,6 @@ requirements_required = set([
     'numpy',
     'psutil',
     'yasha',
-    'xmltodict',
     'Jinja2<2.11',
     'shapely',
     'bokeh',
@@ -112,6 +112,29 @@ except (IOError, ImportError):
     with open('README.md') as f:
         README = f.read()
 
+# Optionally compile the SDF parser modules and the XML base types with
+# Cython, enabled by setting the environment variable
+# PCG_GAZEBO_CYTHONIZE=1 on install. Only available for CPython, the
+# Python sources are kept as reference and used if Cython is not
+# available.
+ext_modules = list()
+if os.environ.get('PCG_GAZEBO_CYTHONIZE', '0') == '1' and \
+        platform.python_implementation() == 'CPython':
+    try:
+        from Cython.Build import cythonize
+        ext_modules = cythonize(
+            [
+                'pcg_gazebo/parsers/sdf/*.py',
+                'pcg_gazebo/parsers/types/*.py'
+            ],
+            exclude=[
+                'pcg_gazebo/parsers/sdf/__init__.py',
+                'pcg_gazebo/parsers/types/__init__.py'
+            ],
+            compiler_directives=dict(language_level=3))
+    except ImportError:
+        print('Cython is not available, installing pure Python modules')
+
 setup(
     name='pcg_gazebo',
     version=__version__,
@@ -125,12 +148,12 @@ setup(
     license='Apache-2.0',
     classifiers=[
         'License :: OSI Approved :: Apache Software License',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8'
     ],
     url='https://github.com/boschresearch/pcg_gazebo',
+    python_requires='>=3.6',
     keywords='gazebo ros simulation robotics sdf urdf robot',
     packages=[
         'pcg_gazebo',
@@ -182,6 +205,7 @@ setup(
         'scripts/pcg-view-gazebo-model',
         'scripts/pcg-view-mesh'
     ],
+    ext_modules=ext_modules,
     install_requires=list(requirements_required),
     extras_require=dict(
         all=list(requirements_all),
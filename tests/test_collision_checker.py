@@ -136,6 +136,38 @@ class TestCollisionChecker(unittest.TestCase):
 
             self.assertTrue(cc.check_collision_with_current_scene(model))
 
+    def test_moved_scene_model(self):
+        main_sphere = sphere(mass=1, radius=0.5, name='sphere')
+        model = sphere(
+            mass=1, radius=0.5, name='test', pose=[2, 0, 0, 0, 0, 0])
+
+        cc = CollisionChecker()
+        cc.add_model(main_sphere)
+        self.assertFalse(cc.check_collision_with_current_scene(model))
+
+        # The scene must be updated after a scene model is moved
+        main_sphere.pose = [2, 0, 0, 0, 0, 0]
+        self.assertTrue(cc.check_collision_with_current_scene(model))
+
+        cc.reset_scenario()
+        self.assertFalse(cc.check_collision_with_current_scene(model))
+
+    def test_invalidate_scene_cache(self):
+        main_sphere = sphere(mass=1, radius=0.5, name='sphere')
+        model = sphere(
+            mass=1, radius=0.5, name='test', pose=[1.2, 0, 0, 0, 0, 0])
+
+        cc = CollisionChecker()
+        cc.add_model(main_sphere)
+        self.assertFalse(cc.check_collision_with_current_scene(model))
+
+        # Changes to a scene model other than its pose are only taken
+        # into account once the cache is invalidated
+        collision = main_sphere.get_link_by_name('link').collisions[0]
+        collision.geometry.set_sphere(1)
+        cc.invalidate()
+        self.assertTrue(cc.check_collision_with_current_scene(model))
+
 
 if __name__ == '__main__':
     unittest.main()
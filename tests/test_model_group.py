@@ -376,6 +376,19 @@ class TestModelGroup(unittest.TestCase):
         self.assertEqual(len(group_lights), 1)
         self.assertIn('root/nested/light', group_lights)
 
+    def test_set_nested_model_as_ground_plane(self):
+        nested_group = ModelGroup(name='nested')
+        nested_group.add_model(
+            'floor', box_factory(size=[[1, 1, 1]], mass=1)[0])
+        root_group = ModelGroup(name='root')
+        root_group.add_model('nested', nested_group)
+
+        self.assertTrue(root_group.set_as_ground_plane('nested/floor'))
+        model = root_group.get_model('nested/floor')
+        self.assertEqual(model.name, 'root/nested/floor')
+        self.assertTrue(model.is_ground_plane)
+        self.assertFalse(root_group.set_as_ground_plane('other/floor'))
+
     def test_load_from_sdf(self):
         lights = [Light(name=generate_random_string(5)) for _ in range(3)]
         models = [SimulationModel(name=generate_random_string(5))
@@ -17,7 +17,7 @@ import unittest
 import random
 import os
 from pcg_gazebo.utils import generate_random_string
-from pcg_gazebo.parsers import parse_sdf
+from pcg_gazebo.parsers import parse_sdf, parse_xml_str
 from pcg_gazebo.parsers.sdf import create_sdf_element
 from pcg_gazebo.parsers.types import XMLScalar, XMLVector, XMLString, \
     XMLInteger, XMLBoolean
@@ -64,6 +64,13 @@ class TestParseSDF(unittest.TestCase):
         self.assertEqual(len(sdf.actors[0].animations), 8)
         self.assertEqual(len(sdf.actors[0].script.trajectories), 13)
 
+    def test_parse_xml_bytes(self):
+        xml_str = '<model name="box"><static>1</static></model>'
+        for xml_input in [xml_str, xml_str.encode('utf-8')]:
+            sdf = parse_xml_str(xml_input)
+            self.assertEqual(sdf.name, 'box')
+            self.assertTrue(sdf.static.value)
+
     def test_parse_string_sdf_strings(self):
         def generate_string_test_obj(name, value=None):
             if value is None:
@@ -16,7 +16,9 @@
 import sys
 import unittest
 from pcg_gazebo.parsers.sdf import create_sdf_element, \
-    get_all_sdf_element_classes
+    create_sdf_type, get_all_sdf_element_classes
+from pcg_gazebo.parsers.sdf.control import Control
+from pcg_gazebo.parsers.sdf.plugin import Plugin
 from pcg_gazebo.parsers.sdf_config import \
     create_sdf_config_element, get_all_sdf_config_element_classes
 from pcg_gazebo.parsers.urdf import create_urdf_element
@@ -3378,6 +3380,76 @@ class TestSDFParser(unittest.TestCase):
         l2 = sdf_obj.urdf.get_link_by_name('link2')
         self.assertIsNotNone(l2, 'No link link2 found')
 
+    def test_child_element_properties(self):
+        sdf_obj = create_sdf_element('heightmap')
+        self.assertIsNotNone(sdf_obj, 'Invalid heightmap object')
+
+        # Accessors are generated from the children creators
+        self.assertEqual(sdf_obj.uri.value, '__default__')
+        sdf_obj.uri = 'file://heightmap.png'
+        self.assertEqual(sdf_obj.uri.value, 'file://heightmap.png')
+        self.assertIs(sdf_obj.uri, sdf_obj.children['uri'])
+
+        sdf_obj.size = [2, 3, 4]
+        self.assertEqual(sdf_obj.size.value, [2, 3, 4])
+
+        # Multiple instance children are not exposed as single elements
+        self.assertFalse(hasattr(sdf_obj, 'texture'))
+        self.assertFalse(hasattr(sdf_obj, 'blend'))
+
+    def test_heightmap_shared_defaults(self):
+        hm_1 = create_sdf_element('heightmap')
+        hm_1.reset(with_optional_elements=True)
+        hm_1.size.width = 5
+        hm_1.pos.value[0] = 3
+
+        # Changing a child element does not change the class defaults
+        hm_2 = create_sdf_element('heightmap')
+        hm_2.reset(with_optional_elements=True)
+        self.assertEqual(hm_2.size.value, [1, 1, 1])
+        self.assertEqual(hm_2.pos.value, [0, 0, 0])
+
+    def test_attributes_validators(self):
+        control = Control()
+        control.channel = 3
+        self.assertEqual(control.channel, 3)
+        with self.assertRaises(TypeError):
+            control.channel = 1.5
+        with self.assertRaises(TypeError):
+            control.channel = 'a'
+
+    def test_plugin_filename(self):
+        plugin = create_sdf_element('plugin')
+        plugin.filename = 'libcustom_plugin.so'
+        self.assertEqual(plugin.filename, 'libcustom_plugin.so')
+        for value in ['', 'libcustom_plugin.sofa.xml', 'plugin']:
+            with self.assertRaises(AssertionError):
+                plugin.filename = value
+
+        plugin = Plugin.gazebo_ros_bumper()
+        self.assertEqual(plugin.filename, 'libgazebo_ros_bumper.so')
+
+    def test_create_sdf_type(self):
+        for c in get_all_sdf_element_classes():
+            self.assertEqual(create_sdf_type(c._NAME)._NAME, c._NAME)
+        self.assertIsNone(create_sdf_type('invalid_sdf_element'))
+        self.assertIsNone(create_sdf_element('invalid_sdf_element'))
+
+    def test_world_extend_children(self):
+        world = create_sdf_element('world')
+        world.add_model('box')
+        models = [(name, create_sdf_element('model'))
+                  for name in ['box', 'sphere', 'cylinder']]
+        world._extend_children('model', models)
+        self.assertEqual(
+            [model.name for model in world.models],
+            ['box', 'sphere', 'cylinder'])
+        self.assertIs(world.models[1], models[1][1])
+
+        world._extend_children('light', list())
+        self.assertIsNone(world.lights)
+        self.assertTrue(world.is_valid())
+
     def test_reset_sdf(self):
         for c in get_all_sdf_element_classes():
             obj = create_sdf_element(c._NAME)
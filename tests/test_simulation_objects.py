@@ -25,7 +25,7 @@ from pcg_gazebo.simulation import load_gazebo_models, get_gazebo_model_sdf, \
     get_gazebo_model_sdf_filenames
 from pcg_gazebo.simulation import Box, Cylinder, Sphere, Joint, \
     SimulationModel
-from pcg_gazebo.simulation.properties import Pose
+from pcg_gazebo.simulation.properties import Pose, Footprint
 from pcg_gazebo.parsers import parse_sdf, parse_sdf_config
 from pcg_gazebo.parsers.urdf import create_urdf_element
 
@@ -1145,6 +1145,17 @@ class TestSimulationObjects(unittest.TestCase):
         with self.assertRaises(ValueError):
             SimulationModel.from_urdf(urdf)
 
+    def test_combine_footprint_polygons(self):
+        footprint = Footprint()
+        footprint.add_circle([0, 0], 1)
+        footprint.add_circle([1, 0], 1)
+        footprint.add_circle([5, 0], 1)
+        polygon = footprint.get_footprint_polygon()
+        self.assertEqual(polygon.geom_type, 'MultiPolygon')
+        self.assertEqual(len(polygon.geoms), 2)
+        # The overlap of the first two circles is counted only once
+        self.assertLess(polygon.area, 3 * np.pi)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -17,9 +17,11 @@ import os
 import unittest
 from pcg_gazebo.generators.creators import extrude, box
 from pcg_gazebo.generators.shapes import random_rectangle
-from pcg_gazebo.simulation import World
+from pcg_gazebo.simulation import World, ModelGroup
+from pcg_gazebo.simulation.properties import Plugin
 from pcg_gazebo.parsers import parse_sdf
 from pcg_gazebo import random
+from pcg_gazebo.utils import has_string_pattern, get_string_pattern_matcher
 
 
 class TestWorld(unittest.TestCase):
@@ -92,6 +94,20 @@ class TestWorld(unittest.TestCase):
         self.assertIsNotNone(free_space_polygon)
         self.assertGreater(free_space_polygon.area, 0)
 
+    def test_random_spots_for_model_wider_than_limits(self):
+        # The limits only bound the sampled model origins
+        world = World()
+        box_model = box(size=[3, 0.1, 0.1], pose=[0, 0, 0.05, 0, 0, 0])
+        poses = world.get_random_free_spots(
+            box_model,
+            n_spots=3,
+            x_limits=[0, 2],
+            y_limits=[0, 2])
+        self.assertEqual(len(poses), 3)
+        for pose in poses:
+            self.assertTrue(0 <= pose.x <= 2)
+            self.assertTrue(0 <= pose.y <= 2)
+
     def test_parse_world_files(self):
         world_dir = os.path.join(
             os.path.dirname(os.path.abspath(__file__)),
@@ -145,6 +161,51 @@ class TestWorld(unittest.TestCase):
                         if obj.has_value():
                             self.assertEqual(obj, getattr(w_sdf.world, tag))
 
+    def test_duplicated_plugin_and_group_names(self):
+        world = World()
+        for _ in range(4):
+            world.add_plugin(
+                'plugin', Plugin(name='plugin', filename='libplugin.so'))
+        for name in ['plugin', 'plugin_1', 'plugin_2', 'plugin_3']:
+            self.assertTrue(world.plugin_exists(name))
+        self.assertFalse(world.plugin_exists('plugin_4'))
+
+        world.rm_plugin('plugin_1')
+        world.add_plugin(
+            'plugin', Plugin(name='plugin', filename='libplugin.so'))
+        self.assertFalse(world.plugin_exists('plugin_1'))
+        self.assertTrue(world.plugin_exists('plugin_4'))
+
+        for _ in range(3):
+            world.add_model_group(ModelGroup(name='group'))
+        for name in ['group', 'group_1', 'group_2']:
+            self.assertIn(name, world.model_groups)
+            self.assertEqual(world.model_groups[name].name, name)
+
+    def test_set_grouped_model_as_ground_plane(self):
+        world = World()
+        world.add_model('floor', box(size=[1, 1, 1], mass=1), group='group')
+        self.assertTrue(world.set_as_ground_plane('group/floor'))
+        self.assertTrue(
+            world.get_model('group/floor').is_ground_plane)
+        self.assertFalse(world.set_as_ground_plane('none/floor'))
+        self.assertFalse(world.set_as_ground_plane('floor'))
+
+    def test_string_pattern_matcher(self):
+        patterns = ['box', '*box', 'box*', '*box*', 'b*x', '*']
+        names = ['box', 'my_box', 'box_1', 'my_box_1', 'bx', 'b.x', '']
+        for pattern in patterns:
+            is_match = get_string_pattern_matcher([pattern])
+            for name in names:
+                self.assertEqual(
+                    is_match(name), has_string_pattern(name, pattern))
+
+        is_match = get_string_pattern_matcher(['ground_plane', 'wall_*'])
+        self.assertTrue(is_match('ground_plane'))
+        self.assertTrue(is_match('wall_1'))
+        self.assertFalse(is_match('box'))
+        self.assertFalse(get_string_pattern_matcher(list())('box'))
+
 
 if __name__ == '__main__':
     unittest.main()